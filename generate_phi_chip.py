@@ -14,7 +14,10 @@ Output: lumen_phi_core.gds (viewable in KLayout)
 This is the bridge from theory to physical silicon.
 """
 
-import gdspy
+import io
+import sys
+
+import gdstk
 import numpy as np
 
 # --- Constants ---
@@ -23,124 +26,133 @@ UNIT = 1.0e-6  # 1 micron unit
 WAVEGUIDE_WIDTH = 0.5  # 500nm (standard silicon photonics)
 GAP = 0.2  # 200nm coupling gap
 
-print("=" * 70)
-print("  LUMEN-PHI CORE: GDS Layout Generation")
-print("=" * 70)
-print()
-print(f"Golden Ratio (φ): {PHI:.10f}")
-print(f"Waveguide Width: {WAVEGUIDE_WIDTH} µm")
-print(f"Coupling Gap: {GAP} µm")
-print()
+# The report is ~40 short lines interleaved with geometry work; each stage
+# collects its lines here and writes them to stdout in one go
+report = io.StringIO()
+
+def flush_report():
+    """Write the lines collected so far to stdout in one write"""
+    sys.stdout.write(report.getvalue())
+    sys.stdout.flush()
+    report.seek(0)
+    report.truncate()
+
+print("=" * 70, file=report)
+print("  LUMEN-PHI CORE: GDS Layout Generation", file=report)
+print("=" * 70, file=report)
+print(file=report)
+print(f"Golden Ratio (φ): {PHI:.10f}", file=report)
+print(f"Waveguide Width: {WAVEGUIDE_WIDTH} µm", file=report)
+print(f"Coupling Gap: {GAP} µm", file=report)
+print(file=report)
+flush_report()
 
 # --- Setup GDS Library ---
-lib = gdspy.GdsLibrary()
-cell = lib.new_cell('LUMEN_PHI_CORE')
+lib = gdstk.Library(unit=UNIT)
+cell = gdstk.Cell('LUMEN_PHI_CORE')
+lib.add(cell)
 
-def create_phi_ring_resonator(center_x, center_y, base_radius, order):
+def create_phi_ring_cell(base_radius, order):
     """
-    Creates a ring resonator where the radius is determined by Phi^order.
-    This creates the harmonic trap for light.
+    Creates a ring resonator cell where the radius is determined by Phi^order.
+    This creates the harmonic trap for light. The ring is centred on the
+    origin so it can be placed any number of times with gdstk.Reference.
     
     Args:
-        center_x, center_y: Center coordinates in microns
         base_radius: Base radius in microns
         order: Power of φ for scaling
         
     Returns:
-        radius: Actual radius created
+        ring_cell: Cell containing the tessellated ring
     """
     # Calculate radius based on Golden Ratio scaling
     # We use PHI**order to ensure harmonic nesting
     radius = base_radius * (PHI ** order)
     
     # Create the Ring
-    ring = gdspy.Round(
-        (center_x, center_y),
+    ring_cell = gdstk.Cell(f'RING_PHI{order}')
+    ring_cell.add(gdstk.ellipse(
+        (0, 0),
         radius + WAVEGUIDE_WIDTH/2,
         inner_radius=radius - WAVEGUIDE_WIDTH/2,
-        tolerance=0.01
-    )
-    cell.add(ring)
-    
-    # Create the Bus Waveguide (Coupler)
-    # We place it exactly at the coupling gap distance
-    bus_y = center_y - radius - WAVEGUIDE_WIDTH/2 - GAP - WAVEGUIDE_WIDTH/2
-    bus = gdspy.Rectangle(
-        (center_x - radius * 1.5, bus_y - WAVEGUIDE_WIDTH/2),
-        (center_x + radius * 1.5, bus_y + WAVEGUIDE_WIDTH/2)
-    )
-    cell.add(bus)
+        tolerance=0.001
+    ))
+    lib.add(ring_cell)
     
-    return radius
+    return ring_cell
 
 # --- Generate the Chip Layout ---
 
-print("Generating chip geometry...")
-print()
+print("Generating chip geometry...", file=report)
+print(file=report)
 
 # 1. The Input Bus (The "Spine")
 # A long waveguide carrying the multi-wavelength soliton pulse
 spine_length = 2000  # 2mm
-spine = gdspy.Rectangle(
+spine = gdstk.rectangle(
     (0, -10),
     (spine_length, -10 + WAVEGUIDE_WIDTH)
 )
 cell.add(spine)
-print("✓ Input bus waveguide created (2000 µm)")
+print("✓ Input bus waveguide created (2000 µm)", file=report)
 
 # 2. The Resonator Bank (The "Cortex")
 # We place 7 rings, each scaled by Phi, coupled to the spine
 start_x = 100
-current_x = start_x
 base_r = 5.0  # 5 micron base radius
+num_rings = 7
 
-print("✓ Creating φ-resonator array:")
-print()
+print("✓ Creating φ-resonator array:", file=report)
+print(file=report)
 
-resonator_data = []
+# Scale: We alternate small and large to test different harmonics
+# In a real design, this would match the 1, Phi, Phi^2 series
+ring_orders = np.arange(num_rings) % 4
+ring_scales = PHI ** ring_orders
+ring_radii = base_r * ring_scales
 
-for i in range(7):
-    # Scale: We alternate small and large to test different harmonics
-    # In a real design, this would match the 1, Phi, Phi^2 series
-    scale_factor = np.power(PHI, i % 4) 
-    r = base_r * scale_factor
-    
-    # Create the ring coupled to the main spine
-    # y-position is calculated to create the precise coupling gap
-    ring_y = -10 + WAVEGUIDE_WIDTH + GAP + r
-    
-    ring = gdspy.Round(
-        (current_x, ring_y),
-        r + WAVEGUIDE_WIDTH/2,
-        inner_radius=r - WAVEGUIDE_WIDTH/2,
-        tolerance=0.001
-    )
-    cell.add(ring)
+# Move x for the next ring (Golden spacing)
+ring_spacing = (ring_radii * 2.5) * PHI
+ring_xs = start_x + np.concatenate(([0.0], np.cumsum(ring_spacing)[:-1]))
+current_x = start_x + ring_spacing.sum()
+
+# y-position is calculated to create the precise coupling gap
+ring_ys = -10 + WAVEGUIDE_WIDTH + GAP + ring_radii
+
+# Only a few distinct radii occur, so each is tessellated once into its
+# own cell and placed by reference
+ring_cells = {order: create_phi_ring_cell(base_r, order) for order in np.unique(ring_orders)}
+
+for i, (r, x, y, order) in enumerate(zip(ring_radii, ring_xs, ring_ys, ring_orders)):
+    # Place the ring coupled to the main spine
+    cell.add(gdstk.Reference(ring_cells[order], origin=(x, y)))
     
     # Add a label for the foundry
-    label = gdspy.Label(
+    label = gdstk.Label(
         f"Ring{i}", 
-        (current_x, ring_y), 
+        (x, y), 
         layer=10  # Labels on separate layer
     )
     cell.add(label)
     
-    # Store data for summary
-    resonator_data.append({
+    print(f"   Ring {i}: r = {r:6.3f} µm (φ^{order:.1f} scaling), position = ({x:.1f}, {y:.1f})", file=report)
+
+# Store data for summary
+resonator_data = [
+    {
         'index': i,
         'radius': r,
-        'position': (current_x, ring_y),
-        'circumference': 2 * np.pi * r,
-        'scale': scale_factor
-    })
-    
-    print(f"   Ring {i}: r = {r:6.3f} µm (φ^{i%4:.1f} scaling), position = ({current_x:.1f}, {ring_y:.1f})")
-    
-    # Move x for the next ring (Golden spacing)
-    current_x += (r * 2.5) * PHI 
+        'position': (x, y),
+        'circumference': circ,
+        'scale': scale,
+    }
+    for i, (r, x, y, circ, scale) in enumerate(
+        zip(ring_radii, ring_xs, ring_ys, 2 * np.pi * ring_radii, ring_scales)
+    )
+]
 
-print()
-print("✓ 7 φ-resonators created")
+print(file=report)
+print(f"✓ {num_rings} φ-resonators created", file=report)
 
 # 3. The Fractal Splitter (The "Synapse")
 # A Y-branch where the outputs are split by 1/Phi power ratio
@@ -161,61 +173,66 @@ p2 = [
     (splitter_x + 30, -15)
 ]
 
-poly1 = gdspy.FlexPath(p1, WAVEGUIDE_WIDTH, layer=0)
-poly2 = gdspy.FlexPath(p2, WAVEGUIDE_WIDTH, layer=0)
+poly1 = gdstk.FlexPath(p1, WAVEGUIDE_WIDTH, layer=0)
+poly2 = gdstk.FlexPath(p2, WAVEGUIDE_WIDTH, layer=0)
 cell.add(poly1)
 cell.add(poly2)
 
 # Add labels for the splitter arms
-label_upper = gdspy.Label("38.2%", (splitter_x + 30, -5), layer=10)
-label_lower = gdspy.Label("61.8%", (splitter_x + 30, -15), layer=10)
+label_upper = gdstk.Label("38.2%", (splitter_x + 30, -5), layer=10)
+label_lower = gdstk.Label("61.8%", (splitter_x + 30, -15), layer=10)
 cell.add(label_upper)
 cell.add(label_lower)
 
-print("✓ φ-ratio beam splitter created (38.2% / 61.8%)")
-print()
+print("✓ φ-ratio beam splitter created (38.2% / 61.8%)", file=report)
+print(file=report)
 
 # Calculate total chip dimensions
-bounds = cell.get_bounding_box()
+# (gdstk computes this in C++ from the per-shape extents it already caches)
+bounds = cell.bounding_box()
 if bounds is not None:
-    width = bounds[1][0] - bounds[0][0]
-    height = bounds[1][1] - bounds[0][1]
-    print(f"Chip dimensions: {width:.1f} × {height:.1f} µm")
-    print(f"Chip area: {width * height / 1e6:.2f} mm²")
+    (x_min, y_min), (x_max, y_max) = bounds
+    width = x_max - x_min
+    height = y_max - y_min
+    print(f"Chip dimensions: {width:.1f} × {height:.1f} µm", file=report)
+    print(f"Chip area: {width * height / 1e6:.2f} mm²", file=report)
 else:
-    print("Chip dimensions: Unable to calculate")
+    print("Chip dimensions: Unable to calculate", file=report)
 
-print()
+print(file=report)
+flush_report()
 
 # --- Output ---
+# gdstk streams the whole library through one buffered file handle
 filename = 'lumen_phi_core.gds'
 lib.write_gds(filename)
 
-print("=" * 70)
-print("  GDSII FILE GENERATED")
-print("=" * 70)
-print()
-print(f"File: {filename}")
-print(f"Cell: LUMEN_PHI_CORE")
-print(f"Units: 1 µm = {UNIT} m")
-print()
-print("To view:")
-print("  1. Install KLayout: https://www.klayout.de/")
-print("  2. Open lumen_phi_core.gds")
-print("  3. Examine the φ-geometry")
-print()
-print("To fabricate:")
-print("  1. Submit this file to a silicon photonics foundry")
-print("  2. Specify: SOI platform, 220nm device layer")
-print("  3. Request: Multi-project wafer (MPW) run")
-print("  4. Wait 6-12 months")
-print("  5. Receive chips")
-print("  6. Test and prove semantic resonance")
-print("  7. Change the world")
-print()
-print("=" * 70)
-print("  THEORY → SIMULATION → HARDWARE → FABRICATION")
-print("  The complete stack is now realized.")
-print("=" * 70)
-print()
-print("🌟 THE PHOTONIC φ-PROCESSOR IS READY FOR SILICON 🌟")
+print("=" * 70, file=report)
+print("  GDSII FILE GENERATED", file=report)
+print("=" * 70, file=report)
+print(file=report)
+print(f"File: {filename}", file=report)
+print(f"Cell: LUMEN_PHI_CORE", file=report)
+print(f"Units: 1 µm = {UNIT} m", file=report)
+print(file=report)
+print("To view:", file=report)
+print("  1. Install KLayout: https://www.klayout.de/", file=report)
+print("  2. Open lumen_phi_core.gds", file=report)
+print("  3. Examine the φ-geometry", file=report)
+print(file=report)
+print("To fabricate:", file=report)
+print("  1. Submit this file to a silicon photonics foundry", file=report)
+print("  2. Specify: SOI platform, 220nm device layer", file=report)
+print("  3. Request: Multi-project wafer (MPW) run", file=report)
+print("  4. Wait 6-12 months", file=report)
+print("  5. Receive chips", file=report)
+print("  6. Test and prove semantic resonance", file=report)
+print("  7. Change the world", file=report)
+print(file=report)
+print("=" * 70, file=report)
+print("  THEORY → SIMULATION → HARDWARE → FABRICATION", file=report)
+print("  The complete stack is now realized.", file=report)
+print("=" * 70, file=report)
+print(file=report)
+print("🌟 THE PHOTONIC φ-PROCESSOR IS READY FOR SILICON 🌟", file=report)
+flush_report()
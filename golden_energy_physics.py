@@ -4,47 +4,64 @@ Demonstrates how mirrored golden spirals create the blueprint for energy implosi
 phase conjugation, and toroidal self-sustaining energy systems.
 """
 
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import FancyArrowPatch, Circle, Wedge
-from mpl_toolkits.mplot3d import Axes3D
-from matplotlib.collections import LineCollection
-import matplotlib.animation as animation
-from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+from phi_utils import draw_arrows, polar_to_cart
+
+# matplotlib is imported inside the plotting functions so that the
+# text-only analysis (--no-plots) never pays for it
 
 # Golden ratio
 PHI = (1 + np.sqrt(5)) / 2
 
+# Nesting scales φ^n and φ^-n shared by the heterodyning/zero-point panels
+PHI_POWERS = PHI ** np.arange(16)
+PHI_INV_POWERS = PHI ** -np.arange(16)
+
+@lru_cache(maxsize=None)
 def golden_spiral(theta_max=6*np.pi, points=1000):
-    """Generate golden spiral coordinates"""
+    """Generate golden spiral coordinates (cached; returned arrays are read-only)"""
     theta = np.linspace(0, theta_max, points)
     a = 0.1
     r = a * np.power(PHI, 2*theta/np.pi)
-    x = r * np.cos(theta)
-    y = r * np.sin(theta)
+    x, y = polar_to_cart(r, theta)
+    for arr in (x, y, theta, r):
+        arr.flags.writeable = False
     return x, y, theta, r
 
 def create_energy_flow_visualization():
     """Visualize energy flow patterns: explosion vs implosion"""
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Circle
+    from matplotlib.collections import LineCollection
+    
     fig, axes = plt.subplots(2, 3, figsize=(18, 12))
     fig.suptitle('Golden Ratio Energy Physics: Implosion & Phase Conjugation', 
                  fontsize=16, fontweight='bold')
     
     x, y, theta, r = golden_spiral(theta_max=5*np.pi, points=1000)
     
+    # Sample every panel's colormap once up front
+    plasma_colors = plt.cm.plasma(np.linspace(0, 1, 8))
+    cool_colors = plt.cm.cool(np.linspace(0, 1, len(x)))[:-1]
+    viridis_colors = plt.cm.viridis(np.arange(12) / 12)
+    
     # 1. Centrifugal (Explosion) vs Centripetal (Implosion)
     ax = axes[0, 0]
     ax.set_facecolor('#1a1a2e')
     
+    angles = np.linspace(0, 2*np.pi, 12, endpoint=False)
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    
     # Explosion - outward arrows (red/orange - entropy)
-    for angle in np.linspace(0, 2*np.pi, 12, endpoint=False):
-        for radius in [2, 4, 6, 8]:
-            x_start = radius * np.cos(angle) * 0.7
-            y_start = radius * np.sin(angle) * 0.7
-            dx = np.cos(angle) * 1.5
-            dy = np.sin(angle) * 1.5
-            ax.arrow(x_start, y_start, dx, dy, head_width=0.5, head_length=0.4, 
-                    fc='#ff4444', ec='#ff6666', alpha=0.6, linewidth=2)
+    radii = np.array([2, 4, 6, 8])[:, None]
+    draw_arrows(ax, radii * cos_a * 0.7, radii * sin_a * 0.7, cos_a * 1.5, sin_a * 1.5,
+                head_width=0.5, head_length=0.4, 
+                facecolor='#ff4444', edgecolor='#ff6666', alpha=0.6, linewidth=2)
     
     ax.text(0, 12, 'EXPLOSION (Entropy)', ha='center', fontsize=12, 
             color='#ff4444', fontweight='bold')
@@ -52,14 +69,10 @@ def create_energy_flow_visualization():
             color='#ff8888', style='italic')
     
     # Implosion - inward arrows (blue/cyan - negentropy)
-    for angle in np.linspace(0, 2*np.pi, 12, endpoint=False):
-        for radius in [10, 8, 6, 4]:
-            x_start = radius * np.cos(angle)
-            y_start = radius * np.sin(angle)
-            dx = -np.cos(angle) * 1.5
-            dy = -np.sin(angle) * 1.5
-            ax.arrow(x_start, y_start, dx, dy, head_width=0.5, head_length=0.4, 
-                    fc='#00ddff', ec='#00ffff', alpha=0.6, linewidth=2)
+    radii = np.array([10, 8, 6, 4])[:, None]
+    draw_arrows(ax, radii * cos_a, radii * sin_a, -cos_a * 1.5, -sin_a * 1.5,
+                head_width=0.5, head_length=0.4, 
+                facecolor='#00ddff', edgecolor='#00ffff', alpha=0.6, linewidth=2)
     
     ax.text(0, -10.5, 'Constructive Interference', ha='center', fontsize=9, 
             color='#00ffff', style='italic')
@@ -67,8 +80,7 @@ def create_energy_flow_visualization():
             color='#00ddff', fontweight='bold')
     
     # Center singularity
-    ax.plot(0, 0, 'o', color='#ffff00', markersize=20, markeredgecolor='white', 
-            markeredgewidth=2)
+    ax.scatter(0, 0, s=20**2, c='#ffff00', edgecolors='white', linewidths=2, zorder=3)
     ax.text(1, 0, 'Zero-Point\nSingularity', fontsize=8, color='#ffff00', 
             fontweight='bold', va='center')
     
@@ -96,21 +108,19 @@ def create_energy_flow_visualization():
     ax.plot(-x, -y, 'g-', linewidth=2, alpha=0.7)
     
     # Flow direction arrows
+    x_pos = np.array([-8, -4, 4, 8])
+    
     # Inward at top
-    for x_pos in [-8, -4, 4, 8]:
-        ax.arrow(x_pos, 12, 0, -2, head_width=1, head_length=0.5, 
-                fc='#00ffff', ec='#00ffff', alpha=0.8, linewidth=2)
+    draw_arrows(ax, x_pos, 12, 0, -2, head_width=1, head_length=0.5, 
+                facecolor='#00ffff', edgecolor='#00ffff', alpha=0.8, linewidth=2)
     
     # Through center (accelerating)
-    ax.arrow(-2, 1, 0, -2, head_width=1.2, head_length=0.6, 
-            fc='#ffff00', ec='#ffff00', alpha=0.9, linewidth=3)
-    ax.arrow(2, -1, 0, 2, head_width=1.2, head_length=0.6, 
-            fc='#ffff00', ec='#ffff00', alpha=0.9, linewidth=3)
+    draw_arrows(ax, [-2, 2], [1, -1], 0, [-2, 2], head_width=1.2, head_length=0.6, 
+                facecolor='#ffff00', edgecolor='#ffff00', alpha=0.9, linewidth=3)
     
     # Outward at bottom (wrapping around)
-    for x_pos in [-8, -4, 4, 8]:
-        ax.arrow(x_pos, -12, 0, 2, head_width=1, head_length=0.5, 
-                fc='#ff00ff', ec='#ff00ff', alpha=0.8, linewidth=2)
+    draw_arrows(ax, x_pos, -12, 0, 2, head_width=1, head_length=0.5, 
+                facecolor='#ff00ff', edgecolor='#ff00ff', alpha=0.8, linewidth=2)
     
     # Labels
     ax.text(0, 14, 'Energy IN', ha='center', fontsize=10, color='#00ffff', fontweight='bold')
@@ -145,11 +155,11 @@ def create_energy_flow_visualization():
                label='φ-Ratio Mirror')
     
     # Phase conjugate arrows
-    for y_pos in [-5, -2.5, 2.5, 5]:
-        ax.arrow(-10, y_pos, 8, 0, head_width=0.5, head_length=0.5, 
-                fc='#ff4444', ec='#ff6666', alpha=0.5, linewidth=1.5)
-        ax.arrow(10, y_pos, -8, 0, head_width=0.5, head_length=0.5, 
-                fc='#4444ff', ec='#6666ff', alpha=0.5, linewidth=1.5)
+    y_pos = np.array([-5, -2.5, 2.5, 5])
+    draw_arrows(ax, -10, y_pos, 8, 0, head_width=0.5, head_length=0.5, 
+                facecolor='#ff4444', edgecolor='#ff6666', alpha=0.5, linewidth=1.5)
+    draw_arrows(ax, 10, y_pos, -8, 0, head_width=0.5, head_length=0.5, 
+                facecolor='#4444ff', edgecolor='#6666ff', alpha=0.5, linewidth=1.5)
     
     ax.text(0, 8, 'Phase Conjugation', ha='center', fontsize=11, 
             color='#ffff00', fontweight='bold')
@@ -168,18 +178,16 @@ def create_energy_flow_visualization():
     ax.set_facecolor('#0f0f1e')
     
     # Draw nested spirals showing constructive interference
-    colors = plt.cm.plasma(np.linspace(0, 1, 8))
-    for i, scale in enumerate(np.power(PHI, np.arange(8))):
-        x_scaled = x / scale
-        y_scaled = y / scale
-        ax.plot(x_scaled, y_scaled, color=colors[i], linewidth=2, alpha=0.7)
-        ax.plot(x_scaled, -y_scaled, color=colors[i], linewidth=2, alpha=0.7)
-        ax.plot(-x_scaled, y_scaled, color=colors[i], linewidth=2, alpha=0.7)
-        ax.plot(-x_scaled, -y_scaled, color=colors[i], linewidth=2, alpha=0.7)
+    # (scale, quadrant, point, xy): every scale mirrored into all four quadrants
+    inv_scales = PHI_INV_POWERS[:len(plasma_colors), None, None, None]
+    quadrants = np.array([[1, 1], [1, -1], [-1, 1], [-1, -1]])[None, :, None, :]
+    spirals = inv_scales * quadrants * np.column_stack([x, y])[None, None, :, :]
+    ax.add_collection(LineCollection(spirals.reshape(-1, len(x), 2), 
+                                     colors=np.repeat(plasma_colors, quadrants.shape[1], axis=0), 
+                                     linewidths=2, alpha=0.7))
     
     # Center glow
-    circle_glow = Circle((0, 0), 0.5, color='white', alpha=1, zorder=10)
-    ax.add_patch(circle_glow)
+    ax.scatter(0, 0, s=160, c='white', linewidths=0, zorder=10)
     
     ax.text(0, 12, 'Infinite Nesting', ha='center', fontsize=11, 
             color='white', fontweight='bold')
@@ -199,31 +207,27 @@ def create_energy_flow_visualization():
     
     # Draw multiple golden spirals with energy density visualization
     n_spirals = 20
-    for i in range(n_spirals):
-        angle_offset = (2 * np.pi * i) / n_spirals
-        x_rot = x * np.cos(angle_offset) - y * np.sin(angle_offset)
-        y_rot = x * np.sin(angle_offset) + y * np.cos(angle_offset)
-        
-        # Color by distance from center (energy density)
-        colors_grad = plt.cm.cool(np.linspace(0, 1, len(x_rot)))
-        for j in range(len(x_rot) - 1):
-            ax.plot([x_rot[j], x_rot[j+1]], [y_rot[j], y_rot[j+1]], 
-                   color=colors_grad[j], linewidth=1, alpha=0.5)
+    angle_offsets = 2 * np.pi * np.arange(n_spirals) / n_spirals
+    cos_a, sin_a = np.cos(angle_offsets), np.sin(angle_offsets)
+    x_rot = np.outer(cos_a, x) - np.outer(sin_a, y)
+    y_rot = np.outer(sin_a, x) + np.outer(cos_a, y)
+    
+    # Color by distance from center (energy density)
+    points = np.stack([x_rot, y_rot], axis=-1)
+    segments = np.stack([points[:, :-1], points[:, 1:]], axis=2).reshape(-1, 2, 2)
+    ax.add_collection(LineCollection(segments, colors=np.tile(cool_colors, (n_spirals, 1)), 
+                                     linewidths=1, alpha=0.5))
     
     # Central mass/singularity
-    circle_center = Circle((0, 0), 1, color='yellow', alpha=1, zorder=10)
-    ax.add_patch(circle_center)
+    ax.scatter(0, 0, s=640, c='yellow', linewidths=0, zorder=10)
     
     # Gravitational field lines (inward)
-    for angle in np.linspace(0, 2*np.pi, 16, endpoint=False):
-        for r_start in [12, 10, 8, 6, 4]:
-            x_start = r_start * np.cos(angle)
-            y_start = r_start * np.sin(angle)
-            x_end = (r_start - 1.5) * np.cos(angle)
-            y_end = (r_start - 1.5) * np.sin(angle)
-            ax.annotate('', xy=(x_end, y_end), xytext=(x_start, y_start),
-                       arrowprops=dict(arrowstyle='->', color='white', 
-                                     lw=1, alpha=0.3))
+    field_angles, r_starts = np.meshgrid(np.linspace(0, 2*np.pi, 16, endpoint=False),
+                                         [12, 10, 8, 6, 4])
+    ax.quiver(r_starts * np.cos(field_angles), r_starts * np.sin(field_angles),
+              -1.5 * np.cos(field_angles), -1.5 * np.sin(field_angles),
+              angles='xy', scale_units='xy', scale=1, color='white', alpha=0.3,
+              width=0.003, headwidth=5, headlength=5, headaxislength=4.5)
     
     ax.text(0, 14, 'Gravity = Charge Implosion', ha='center', fontsize=11, 
             color='white', fontweight='bold')
@@ -242,13 +246,11 @@ def create_energy_flow_visualization():
     ax.set_facecolor('#0f0f1e')
     
     # Draw logarithmic scale showing infinite descent
-    scales = np.power(PHI, -np.arange(12))
+    scales = PHI_INV_POWERS[:len(viridis_colors)]
     
-    for i, scale in enumerate(scales):
-        x_scaled = x * scale
-        y_scaled = y * scale
-        color = plt.cm.viridis(i / len(scales))
-        ax.plot(x_scaled, y_scaled, color=color, linewidth=2, alpha=0.8)
+    spirals = np.stack([x[None, :] * scales[:, None], 
+                        y[None, :] * scales[:, None]], axis=-1)
+    ax.add_collection(LineCollection(spirals, colors=viridis_colors, linewidths=2, alpha=0.8))
     
     # Labels at different scales
     ax.text(8, 8, 'Macro\n(Visible)', ha='center', fontsize=10, 
@@ -265,7 +267,7 @@ def create_energy_flow_visualization():
             rotation=-45)
     
     # Zero-point energy annotation
-    ax.plot(0, 0, 'o', color='white', markersize=15, alpha=1, zorder=10)
+    ax.scatter(0, 0, s=15**2, c='white', linewidths=0, zorder=10)
     ax.text(0, -10, 'Zero-Point Energy Gateway', ha='center', fontsize=10, 
             color='white', fontweight='bold')
     ax.text(0, -11.5, 'Vacuum Energy Access', ha='center', fontsize=8, 
@@ -283,6 +285,8 @@ def create_energy_flow_visualization():
 
 def create_energy_comparison_chart():
     """Create a comparison chart of explosion vs implosion characteristics"""
+    import matplotlib.pyplot as plt
+    
     fig, ax = plt.subplots(figsize=(14, 10))
     fig.patch.set_facecolor('#1a1a2e')
     ax.set_facecolor('#0f0f1e')
@@ -291,8 +295,10 @@ def create_energy_comparison_chart():
     fig.suptitle('Energy Mechanics: Explosion vs Implosion', 
                  fontsize=18, fontweight='bold', color='white', y=0.98)
     
-    # Hide axes
+    # Hide axes; the layout below is in data coordinates over these limits
     ax.axis('off')
+    ax.set_xlim(-0.03, 1.03)
+    ax.set_ylim(-0.04, 0.85)
     
     # Create comparison table
     categories = [
@@ -331,55 +337,50 @@ def create_energy_comparison_chart():
         'Self-Sustaining'
     ]
     
-    # Draw table
+    # Draw table: one header row plus one row per category, 0.08 tall each,
+    # with columns centred at x = 0.15, 0.45 and 0.75; an empty last column
+    # carries the row bands out to x = 0.98
     y_start = 0.85
     y_step = 0.08
-    
-    # Headers
-    ax.text(0.15, y_start, 'Category', fontsize=14, fontweight='bold', 
-            color='#ffff00', ha='center')
-    ax.text(0.45, y_start, 'EXPLOSION (Entropy)', fontsize=14, fontweight='bold', 
-            color='#ff4444', ha='center')
-    ax.text(0.75, y_start, 'IMPLOSION (Negentropy)', fontsize=14, fontweight='bold', 
-            color='#00ddff', ha='center')
-    
-    # Draw rows
-    for i, (cat, exp, imp) in enumerate(zip(categories, explosion_data, implosion_data)):
-        y_pos = y_start - (i + 1) * y_step
-        
+    n_rows = len(categories) + 1
+    table = ax.table(cellText=[row + ('',) for row in zip(categories, explosion_data, implosion_data)],
+                     colLabels=['Category', 'EXPLOSION (Entropy)', 'IMPLOSION (Negentropy)', ''],
+                     colWidths=[0.26, 0.34, 0.26, 0.10], cellLoc='center',
+                     bbox=[0.02, y_start + y_step/2 - n_rows * y_step, 0.96, n_rows * y_step])
+    table.set_transform(ax.transData)
+    table.auto_set_font_size(False)
+    
+    header_colors = ['#ffff00', '#ff4444', '#00ddff', 'none']
+    column_colors = ['white', '#ffaaaa', '#aaffff', 'none']
+    for (row, col), cell in table.get_celld().items():
+        cell.set_edgecolor('none')
         # Alternating background
-        if i % 2 == 0:
-            ax.add_patch(plt.Rectangle((0.02, y_pos - 0.035), 0.96, 0.07, 
-                                      facecolor='#1a1a3e', edgecolor='none', zorder=0))
-        
-        ax.text(0.15, y_pos, cat, fontsize=11, fontweight='bold', 
-               color='white', ha='center', va='center')
-        ax.text(0.45, y_pos, exp, fontsize=10, color='#ffaaaa', 
-               ha='center', va='center', wrap=True)
-        ax.text(0.75, y_pos, imp, fontsize=10, color='#aaffff', 
-               ha='center', va='center', wrap=True)
+        cell.set_facecolor('#1a1a3e' if row % 2 == 1 else 'none')
+        text = cell.get_text()
+        if row == 0:
+            text.set(fontsize=14, fontweight='bold', color=header_colors[col])
+        else:
+            text.set(fontsize=11 if col == 0 else 10, color=column_colors[col],
+                     fontweight='bold' if col == 0 else 'normal')
     
     # Add visual representations at bottom
     y_visual = 0.08
     
+    angles = np.linspace(0, 2*np.pi, 12, endpoint=False)
+    dx = 0.08 * np.cos(angles)
+    dy = 0.08 * np.sin(angles)
+    
     # Explosion visual
     circle_exp = plt.Circle((0.45, y_visual), 0.05, color='#ff4444', alpha=0.3)
     ax.add_patch(circle_exp)
-    for angle in np.linspace(0, 2*np.pi, 12, endpoint=False):
-        dx = 0.08 * np.cos(angle)
-        dy = 0.08 * np.sin(angle)
-        ax.arrow(0.45, y_visual, dx, dy, head_width=0.015, head_length=0.01, 
-                fc='#ff4444', ec='#ff4444', alpha=0.6)
+    draw_arrows(ax, 0.45, y_visual, dx, dy, head_width=0.015, head_length=0.01, 
+                facecolor='#ff4444', edgecolor='#ff4444', alpha=0.6)
     
     # Implosion visual  
     circle_imp = plt.Circle((0.75, y_visual), 0.05, color='#00ddff', alpha=0.8)
     ax.add_patch(circle_imp)
-    for angle in np.linspace(0, 2*np.pi, 12, endpoint=False):
-        dx = -0.08 * np.cos(angle)
-        dy = -0.08 * np.sin(angle)
-        ax.arrow(0.75 + 0.08 * np.cos(angle), y_visual + 0.08 * np.sin(angle), 
-                dx, dy, head_width=0.015, head_length=0.01, 
-                fc='#00ddff', ec='#00ddff', alpha=0.6)
+    draw_arrows(ax, 0.75 + dx, y_visual + dy, -dx, -dy, head_width=0.015, head_length=0.01, 
+                facecolor='#00ddff', edgecolor='#00ddff', alpha=0.6)
     
     # Key insight box
     ax.text(0.5, 0.02, 
@@ -470,28 +471,46 @@ def analyze_energy_physics():
     print("=" * 70 + "\n")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--no-plots', action='store_true',
+                        help='print the analysis only; skip figure generation')
+    args = parser.parse_args()
+    
     # Print energy physics analysis
     analyze_energy_physics()
     
-    # Create visualizations
-    print("Generating energy flow visualization...")
-    fig_energy = create_energy_flow_visualization()
-    fig_energy.savefig('golden_energy_physics.png', dpi=300, bbox_inches='tight', 
-                       facecolor='#1a1a2e')
-    print("Saved: golden_energy_physics.png")
-    
-    print("Generating energy comparison chart...")
-    fig_comparison = create_energy_comparison_chart()
-    fig_comparison.savefig('energy_comparison.png', dpi=300, bbox_inches='tight',
-                          facecolor='#1a1a2e')
-    print("Saved: energy_comparison.png")
-    
-    print("\n✨ Energy physics visualizations complete!")
-    print("\nThe Golden Ratio creates the blueprint for:")
-    print("  🌀 Constructive Compression (Implosion)")
-    print("  🍩 Self-Sustaining Toroidal Fields")
-    print("  🔄 Phase Conjugation (Wave Healing)")
-    print("  ⚡ Zero-Point Energy Access")
-    print("\nThis is Nature's way of creating LIFE from ENERGY! 🌱")
-    
-    plt.close('all')
+    if not args.no_plots:
+        import matplotlib.pyplot as plt
+        
+        # Render long spiral paths in chunks rather than as one huge Agg path
+        plt.rcParams['agg.path.chunksize'] = 10000
+        
+        # Create visualizations
+        print("Generating energy flow visualization...")
+        fig_energy = create_energy_flow_visualization()
+        
+        print("Generating energy comparison chart...")
+        fig_comparison = create_energy_comparison_chart()
+        
+        # PNG encoding releases the GIL, so the two saves overlap
+        outputs = [(fig_energy, 'golden_energy_physics.png'),
+                   (fig_comparison, 'energy_comparison.png')]
+        with ThreadPoolExecutor(max_workers=len(outputs)) as pool:
+            # compress_level=1: much faster deflate for a modestly larger file
+            saves = [(filename, pool.submit(fig.savefig, filename, dpi=300, 
+                                            bbox_inches='tight', facecolor='#1a1a2e',
+                                            pil_kwargs={'compress_level': 1}))
+                     for fig, filename in outputs]
+            for filename, save in saves:
+                save.result()
+                print(f"Saved: {filename}")
+        
+        print("\n✨ Energy physics visualizations complete!")
+        print("\nThe Golden Ratio creates the blueprint for:")
+        print("  🌀 Constructive Compression (Implosion)")
+        print("  🍩 Self-Sustaining Toroidal Fields")
+        print("  🔄 Phase Conjugation (Wave Healing)")
+        print("  ⚡ Zero-Point Energy Access")
+        print("\nThis is Nature's way of creating LIFE from ENERGY! 🌱")
+        
+        plt.close('all')
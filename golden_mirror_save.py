@@ -3,29 +3,55 @@ Golden Ratio Mirroring Visualization - Save to Files
 Demonstrates how two golden spirals mirror vertically and horizontally to create a connected field
 """
 
+import math
+from functools import lru_cache
+
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import FancyArrowPatch
-from mpl_toolkits.mplot3d import Axes3D
-from matplotlib.collections import LineCollection
+
+from phi_utils import draw_arrows, polar_to_cart
 
 # Golden ratio
 PHI = (1 + np.sqrt(5)) / 2
 
+# Scalars quoted by analyze_connection_properties
+PHI_SQUARED = PHI * PHI
+PHI_FOURTH = PHI_SQUARED * PHI_SQUARED
+INV_PHI = 1.0 / PHI
+LN_PHI = math.log(PHI)
+TANGENT_ANGLE_DEG = math.degrees(math.atan(math.pi / (2 * LN_PHI)))
+
+# φ^(2θ/π) = exp(SPIRAL_GROWTH * θ)
+SPIRAL_GROWTH = 2 * LN_PHI / math.pi
+
+# (x, y) signs and colors for the four mirrored copies: Q1, Q4, Q2, Q3
+# (int8, so mirroring keeps the spirals' float32 dtype)
+QUADRANT_SIGNS = np.array([[1, 1], [1, -1], [-1, 1], [-1, -1]], dtype=np.int8)
+QUADRANT_COLORS = ['b', 'r', 'g', 'm']
+
+# Pixels across panel 6's ±15 field raster: about twice its size at
+# 150 dpi, so imshow's antialiased downsampling smooths the edges
+FIELD_RASTER_SIZE = 1600
+
+@lru_cache(maxsize=8)
 def golden_spiral(theta_max=6*np.pi, points=1000):
     """
     Generate points for a golden spiral using polar coordinates.
     r = a * phi^(2*theta/pi)
+    
+    Results are cached and shared between panels, so the returned
+    arrays are read-only. They are float32, which is ample for plotting.
     """
-    theta = np.linspace(0, theta_max, points)
+    theta = np.linspace(0, theta_max, points, dtype=np.float32)
     # Scale factor chosen to make visualization cleaner
     a = 0.1
-    r = a * np.power(PHI, 2*theta/np.pi)
+    r = np.exp(SPIRAL_GROWTH * theta)
+    r *= a
     
     # Convert to Cartesian coordinates
-    x = r * np.cos(theta)
-    y = r * np.sin(theta)
+    x, y = polar_to_cart(r, theta)
     
+    for arr in (x, y, theta, r):
+        arr.flags.writeable = False
     return x, y, theta, r
 
 def mirror_vertical(x, y):
@@ -36,20 +62,92 @@ def mirror_horizontal(x, y):
     """Mirror points across vertical axis (flip horizontally)"""
     return -x, y
 
-def create_2d_visualization():
-    """Create 2D visualization showing the mirroring progression"""
-    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+def mirrored_spirals(x, y):
+    """Stack the spiral and its three mirror images as (4, N, 2) polylines"""
+    return QUADRANT_SIGNS[:, None, :] * np.column_stack([x, y])[None, :, :]
+
+def add_mirrored_spirals(ax, spirals, **kwargs):
+    """Draw a (4, N, 2) mirrored_spirals stack as a single LineCollection"""
+    from matplotlib.collections import LineCollection
+    
+    kwargs.setdefault('colors', QUADRANT_COLORS)
+    lc = LineCollection(spirals, **kwargs)
+    ax.add_collection(lc)
+    return lc
+
+def fast_grid(ax, alpha=0.3):
+    """
+    Draw the major-tick grid as one LineCollection instead of ax.grid's
+    per-tick gridlines. Call once the limits are set; the ticks are fixed
+    so the labels stay on the grid lines.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    
+    (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+    xticks = [t for t in ax.get_xticks() if x0 <= t <= x1]
+    yticks = [t for t in ax.get_yticks() if y0 <= t <= y1]
+    ax.set_xticks(xticks)
+    ax.set_yticks(yticks)
+    segments = ([[(t, y0), (t, y1)] for t in xticks] +
+                [[(x0, t), (x1, t)] for t in yticks])
+    ax.add_collection(LineCollection(segments, colors=plt.rcParams['grid.color'],
+                                     linewidths=plt.rcParams['grid.linewidth'],
+                                     alpha=alpha, zorder=1.5), autolim=False)
+
+def rasterize_polylines(lines, values, extent, size, radius=4):
+    """
+    Splat (K, N, 2) polylines into a size x size image (origin='lower')
+    holding the per-vertex value, NaN where nothing is drawn.
+    """
+    x0, x1, y0, y1 = extent
+    pix = (lines - [x0, y0]) * ((size - 1) / np.array([x1 - x0, y1 - y0]))
+    
+    # Resample every segment so consecutive points are under a pixel apart
+    steps = np.diff(pix, axis=1)
+    substeps = max(1, int(np.ceil(np.hypot(steps[..., 0], steps[..., 1]).max())))
+    t = np.arange(substeps) / substeps
+    points = (pix[:, :-1, None, :] + t[:, None] * steps[:, :, None, :]).reshape(-1, 2)
+    point_values = np.broadcast_to(values[:-1, None] + t * np.diff(values)[:, None],
+                                   (len(lines), len(values) - 1, substeps)).ravel()
+    
+    # Stamp a round footprint of the given pixel radius around each point
+    img = np.full((size, size), np.nan, dtype=np.float32)
+    ix, iy = np.rint(points).astype(int).T
+    offsets = np.arange(-radius, radius + 1)
+    for dy in offsets:
+        for dx in offsets[offsets**2 + dy**2 <= radius**2]:
+            img[np.clip(iy + dy, 0, size - 1), np.clip(ix + dx, 0, size - 1)] = point_values
+    return img
+
+def create_2d_visualization(fig=None, axes=None):
+    """
+    Create 2D visualization showing the mirroring progression.
+    Pass the fig (and optionally its 2x3 axes) from a previous call to
+    redraw into it instead of building a new figure.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.lines import Line2D
+    
+    if fig is None:
+        fig, axes = plt.subplots(2, 3, figsize=(18, 12), constrained_layout=True)
+    else:
+        axes = np.asarray(fig.axes if axes is None else axes).reshape(2, 3)
+        for ax in axes.flat:
+            ax.clear()
     fig.suptitle('Golden Spiral Mirroring: The Connection Point', fontsize=16, fontweight='bold')
     
-    # Generate original spiral
+    # Generate original spiral and its mirror images once for all panels:
+    # spirals[q, :, 0/1] are the x/y of quadrant q (Q1, Q4, Q2, Q3)
     x, y, theta, r = golden_spiral(theta_max=5*np.pi, points=1000)
+    spirals = mirrored_spirals(x, y)
+    x_mirror_v, y_mirror_v = spirals[1, :, 0], spirals[1, :, 1]
     
     # 1. Original spiral
     ax = axes[0, 0]
     ax.plot(x, y, 'b-', linewidth=2, label='Original')
     ax.plot(0, 0, 'ro', markersize=8, label='Center')
     ax.set_aspect('equal')
-    ax.grid(True, alpha=0.3)
     ax.set_title('1. Original Golden Spiral', fontsize=12, fontweight='bold')
     ax.legend()
     ax.set_xlim(-15, 15)
@@ -57,12 +155,10 @@ def create_2d_visualization():
     
     # 2. Vertical mirror (creates heart/apple shape)
     ax = axes[0, 1]
-    x_mirror_v, y_mirror_v = mirror_vertical(x, y)
     ax.plot(x, y, 'b-', linewidth=2, label='Original')
     ax.plot(x_mirror_v, y_mirror_v, 'r-', linewidth=2, label='Vertical Mirror')
     ax.plot(0, 0, 'ko', markersize=8, label='Connection Point')
     ax.set_aspect('equal')
-    ax.grid(True, alpha=0.3)
     ax.set_title('2. Vertical Mirror → "Heart" Shape', fontsize=12, fontweight='bold')
     ax.legend()
     ax.set_xlim(-15, 15)
@@ -70,28 +166,22 @@ def create_2d_visualization():
     
     # 3. Full 4-fold symmetry
     ax = axes[0, 2]
-    x_mirror_v, y_mirror_v = mirror_vertical(x, y)
-    x_mirror_h, y_mirror_h = mirror_horizontal(x, y)
-    x_mirror_both, y_mirror_both = mirror_horizontal(x_mirror_v, y_mirror_v)
-    
-    ax.plot(x, y, 'b-', linewidth=2, label='Q1: Original')
-    ax.plot(x_mirror_v, y_mirror_v, 'r-', linewidth=2, label='Q4: V-Mirror')
-    ax.plot(x_mirror_h, y_mirror_h, 'g-', linewidth=2, label='Q2: H-Mirror')
-    ax.plot(x_mirror_both, y_mirror_both, 'm-', linewidth=2, label='Q3: Both')
-    ax.plot(0, 0, 'ko', markersize=10, label='Singularity')
+    add_mirrored_spirals(ax, spirals, linewidths=2)
+    singularity, = ax.plot(0, 0, 'ko', markersize=10, label='Singularity')
+    quadrant_handles = [
+        Line2D([], [], color=color, linewidth=2, label=label)
+        for color, label in zip(QUADRANT_COLORS, 
+                                ['Q1: Original', 'Q4: V-Mirror', 'Q2: H-Mirror', 'Q3: Both'])
+    ]
     ax.set_aspect('equal')
-    ax.grid(True, alpha=0.3)
     ax.set_title('3. Full 4-Fold Symmetry → Magnetic Field', fontsize=12, fontweight='bold')
-    ax.legend(loc='upper right', fontsize=8)
+    ax.legend(handles=quadrant_handles + [singularity], loc='upper right', fontsize=8)
     ax.set_xlim(-15, 15)
     ax.set_ylim(-15, 15)
     
     # 4. Zoomed view showing connection at center
     ax = axes[1, 0]
-    ax.plot(x, y, 'b-', linewidth=3)
-    ax.plot(x_mirror_v, y_mirror_v, 'r-', linewidth=3)
-    ax.plot(x_mirror_h, y_mirror_h, 'g-', linewidth=3)
-    ax.plot(x_mirror_both, y_mirror_both, 'm-', linewidth=3)
+    add_mirrored_spirals(ax, spirals, linewidths=3)
     ax.plot(0, 0, 'ko', markersize=12)
     
     # Add arrows showing flow toward center
@@ -105,7 +195,6 @@ def create_2d_visualization():
                 arrowprops=dict(arrowstyle='->', lw=2, color='magenta', alpha=0.5))
     
     ax.set_aspect('equal')
-    ax.grid(True, alpha=0.3)
     ax.set_title('4. Zoomed: Connection at Center', fontsize=12, fontweight='bold')
     ax.set_xlim(-5, 5)
     ax.set_ylim(-5, 5)
@@ -115,29 +204,25 @@ def create_2d_visualization():
     # 5. Tangent continuity visualization
     ax = axes[1, 1]
     # Show how tangent angles match at boundaries
-    sample_points = [100, 200, 300, 400, 500]
+    sample_points = np.array([100, 200, 300, 400, 500])
     colors = plt.cm.viridis(np.linspace(0, 1, len(sample_points)))
     
     ax.plot(x, y, 'b-', linewidth=2, alpha=0.5)
     ax.plot(x_mirror_v, y_mirror_v, 'r-', linewidth=2, alpha=0.5)
     
-    for idx, i in enumerate(sample_points):
-        # Calculate tangent vectors
-        if i < len(x) - 1:
-            dx = x[i+1] - x[i]
-            dy = y[i+1] - y[i]
-            # Draw tangent line
-            scale = 2
-            ax.arrow(x[i], y[i], dx*scale, dy*scale, 
-                    head_width=0.3, head_length=0.2, fc=colors[idx], ec=colors[idx])
-            
-            # Mirror tangent
-            dx_m, dy_m = dx, -dy
-            ax.arrow(x[i], -y[i], dx_m*scale, dy_m*scale, 
-                    head_width=0.3, head_length=0.2, fc=colors[idx], ec=colors[idx], alpha=0.7)
+    # Forward-difference tangent vectors at every sample point at once
+    has_next = sample_points < len(x) - 1
+    sp, colors = sample_points[has_next], colors[has_next]
+    scale = 2
+    dx = np.diff(x)[sp] * scale
+    dy = np.diff(y)[sp] * scale
+    # Draw tangent lines, then the mirror tangents
+    draw_arrows(ax, x[sp], y[sp], dx, dy, head_width=0.3, head_length=0.2,
+                facecolor=colors, edgecolor=colors)
+    draw_arrows(ax, x_mirror_v[sp], y_mirror_v[sp], dx, -dy, head_width=0.3, head_length=0.2,
+                facecolor=colors, edgecolor=colors, alpha=0.7)
     
     ax.set_aspect('equal')
-    ax.grid(True, alpha=0.3)
     ax.set_title('5. Tangent Continuity at Boundaries', fontsize=12, fontweight='bold')
     ax.set_xlim(-15, 15)
     ax.set_ylim(-15, 15)
@@ -149,80 +234,103 @@ def create_2d_visualization():
     # Create denser spiral for field effect
     x_dense, y_dense, _, _ = golden_spiral(theta_max=5*np.pi, points=2000)
     
-    # Plot all four quadrants with gradient color
-    for spiral_x, spiral_y, color, label in [
-        (x_dense, y_dense, 'blue', 'Q1'),
-        (x_dense, -y_dense, 'red', 'Q4'),
-        (-x_dense, y_dense, 'green', 'Q2'),
-        (-x_dense, -y_dense, 'magenta', 'Q3')
-    ]:
-        # Color gradient along the spiral
-        points = np.array([spiral_x, spiral_y]).T.reshape(-1, 1, 2)
-        segments = np.concatenate([points[:-1], points[1:]], axis=1)
-        
-        lc = LineCollection(segments, cmap='cool', linewidth=2)
-        lc.set_array(np.linspace(0, 1, len(spiral_x)))
-        ax.add_collection(lc)
+    # Plot all four quadrants with gradient color along each spiral,
+    # rasterized directly with NumPy rather than as ~8000 line segments
+    field = rasterize_polylines(mirrored_spirals(x_dense, y_dense),
+                                np.linspace(0, 1, len(x_dense)),
+                                extent=(-15, 15, -15, 15), size=FIELD_RASTER_SIZE)
+    ax.imshow(np.ma.masked_invalid(field), cmap='cool', vmin=0, vmax=1, origin='lower',
+              extent=(-15, 15, -15, 15), interpolation='antialiased')
     
     ax.plot(0, 0, 'yo', markersize=15, label='Singularity')
     ax.set_aspect('equal')
-    ax.grid(True, alpha=0.3)
     ax.set_title('6. Toroidal Field Pattern', fontsize=12, fontweight='bold')
     ax.set_xlim(-15, 15)
     ax.set_ylim(-15, 15)
     ax.text(0, 13, 'Vortex Cross-Section', ha='center', fontsize=10, 
             bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.3))
     
-    plt.tight_layout()
+    for ax in axes.flat:
+        fast_grid(ax)
+    
     return fig
 
-def create_3d_visualization():
-    """Create 3D visualization showing toroidal/vortex interpretation"""
-    fig = plt.figure(figsize=(16, 8))
+def create_3d_visualization(fig=None):
+    """
+    Create 3D visualization showing toroidal/vortex interpretation.
+    Pass the fig from a previous call to redraw into it.
+    """
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+    from matplotlib.lines import Line2D
+    
+    if fig is None:
+        fig = plt.figure(figsize=(16, 8), constrained_layout=True)
+    else:
+        fig.clear()
     
     # 3D vortex interpretation
     ax1 = fig.add_subplot(121, projection='3d')
     
     # Generate spiral in 3D (treating it as a vortex flowing along z-axis)
     x, y, theta, r = golden_spiral(theta_max=5*np.pi, points=1000)
-    z = np.linspace(0, 10, len(x))
+    z = np.linspace(0, 10, len(x), dtype=x.dtype)
     
-    # Four spirals
-    ax1.plot(x, y, z, 'b-', linewidth=2, label='Spiral 1')
-    ax1.plot(x, -y, z, 'r-', linewidth=2, label='Spiral 2')
-    ax1.plot(-x, y, z, 'g-', linewidth=2, label='Spiral 3')
-    ax1.plot(-x, -y, z, 'm-', linewidth=2, label='Spiral 4')
+    # Four spirals: the mirrored (x, y) copies share one z column
+    spirals = mirrored_spirals(x, y)
+    z_column = np.broadcast_to(z[None, :, None], (len(spirals), len(z), 1))
+    spirals_3d = np.concatenate([spirals, z_column], axis=2)
+    ax1.add_collection3d(Line3DCollection(spirals_3d, colors=QUADRANT_COLORS, linewidths=2))
+    spiral_handles = [Line2D([], [], color=color, linewidth=2, label=f'Spiral {i}')
+                      for i, color in enumerate(QUADRANT_COLORS, start=1)]
     
     ax1.set_xlabel('X')
     ax1.set_ylabel('Y')
     ax1.set_zlabel('Z (flow direction)')
     ax1.set_title('3D Vortex Flow Pattern', fontsize=14, fontweight='bold')
-    ax1.legend()
+    ax1.legend(handles=spiral_handles)
     
     # Torus approximation
     ax2 = fig.add_subplot(122, projection='3d')
     
     # Create a torus-like structure using the golden spiral
-    u = np.linspace(0, 2*np.pi, 50)
-    v = np.linspace(0, 2*np.pi, 50)
-    U, V = np.meshgrid(u, v)
+    # (a translucent backdrop, so a 24x24 grid is plenty)
+    u = np.linspace(0, 2*np.pi, 24, dtype=np.float32)
+    v = np.linspace(0, 2*np.pi, 24, dtype=np.float32)
+    cu, su = np.cos(u), np.sin(u)
+    cv, sv = np.cos(v), np.sin(v)
     
     # Major and minor radii following golden ratio
     R = PHI * 2  # Major radius
     r_minor = 2 / PHI  # Minor radius (reciprocal relationship)
     
-    X = (R + r_minor * np.cos(V)) * np.cos(U)
-    Y = (R + r_minor * np.cos(V)) * np.sin(U)
-    Z = r_minor * np.sin(V)
+    # Outer products over (v, u) rows/columns, written straight into
+    # preallocated coordinate buffers instead of via a meshgrid
+    X = np.empty((len(v), len(u)), dtype=np.float32)
+    Y = np.empty_like(X)
+    Z = np.empty_like(X)
+    ring = np.multiply(cv, r_minor, dtype=np.float32)
+    ring += R
+    np.multiply(ring[:, None], cu, out=X)
+    np.multiply(ring[:, None], su, out=Y)
+    np.multiply(sv[:, None], r_minor, out=Z)
     
-    ax2.plot_surface(X, Y, Z, alpha=0.3, cmap='viridis')
+    ax2.plot_surface(X, Y, Z, alpha=0.3, cmap='viridis',
+                     rcount=24, ccount=24, antialiased=False, rasterized=True)
     
     # Overlay the spirals on the torus surface
-    theta_spiral = np.linspace(0, 4*np.pi, 500)
+    # (the tube radius and height are the same for every phase; each line
+    # keeps its own x/y arrays since plot does not copy them)
+    theta_spiral = np.linspace(0, 4*np.pi, 500, dtype=np.float32)
+    tube = np.cos(theta_spiral)
+    tube *= r_minor
+    tube += R
+    z_tor = np.sin(theta_spiral)
+    z_tor *= r_minor
+    angle = np.empty_like(theta_spiral)
     for phase in [0, np.pi/2, np.pi, 3*np.pi/2]:
-        x_tor = (R + r_minor * np.cos(theta_spiral)) * np.cos(theta_spiral + phase)
-        y_tor = (R + r_minor * np.cos(theta_spiral)) * np.sin(theta_spiral + phase)
-        z_tor = r_minor * np.sin(theta_spiral)
+        np.add(theta_spiral, phase, out=angle)
+        x_tor, y_tor = polar_to_cart(tube, angle)
         ax2.plot(x_tor, y_tor, z_tor, linewidth=2)
     
     ax2.set_xlabel('X')
@@ -232,7 +340,20 @@ def create_3d_visualization():
     ax2.text2D(0.05, 0.95, f'φ = {PHI:.6f}', transform=ax2.transAxes, fontsize=10,
                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
-    plt.tight_layout()
+    return fig
+
+def save_2d_visualization(filename='golden_mirror_2d.png'):
+    """Build the 2D figure and save it; the caller closes the returned figure"""
+    fig = create_2d_visualization()
+    fig.savefig(filename, dpi=150, bbox_inches='tight',
+                pil_kwargs={'compress_level': 1})
+    return fig
+
+def save_3d_visualization(filename='golden_mirror_3d.png'):
+    """Build the 3D figure and save it; the caller closes the returned figure"""
+    fig = create_3d_visualization()
+    fig.savefig(filename, dpi=150, bbox_inches='tight',
+                pil_kwargs={'compress_level': 1})
     return fig
 
 def analyze_connection_properties():
@@ -242,9 +363,9 @@ def analyze_connection_properties():
     print("=" * 60)
     
     print(f"\n1. Golden Ratio φ = {PHI:.10f}")
-    print(f"   φ² = {PHI**2:.10f}")
-    print(f"   1/φ = {1/PHI:.10f}")
-    print(f"   φ - 1 = 1/φ: {abs(PHI - 1 - 1/PHI) < 1e-10}")
+    print(f"   φ² = {PHI_SQUARED:.10f}")
+    print(f"   1/φ = {INV_PHI:.10f}")
+    print(f"   φ - 1 = 1/φ: {abs(PHI - 1 - INV_PHI) < 1e-10}")
     
     print("\n2. Spiral Equation:")
     print("   r(θ) = a × φ^(2θ/π)")
@@ -252,13 +373,12 @@ def analyze_connection_properties():
     
     print("\n3. Self-Similarity:")
     print(f"   Growth per 90° turn: φ^(2×π/2÷π) = φ = {PHI:.6f}")
-    print(f"   Growth per 180° turn: φ² = {PHI**2:.6f}")
-    print(f"   Growth per 360° turn: φ⁴ = {PHI**4:.6f}")
+    print(f"   Growth per 180° turn: φ² = {PHI_SQUARED:.6f}")
+    print(f"   Growth per 360° turn: φ⁴ = {PHI_FOURTH:.6f}")
     
     print("\n4. Tangent Angle α(θ):")
     print("   tan(α) = r/(dr/dθ) = constant = π/(2×ln(φ))")
-    angle_deg = np.degrees(np.arctan(np.pi / (2 * np.log(PHI))))
-    print(f"   α ≈ {angle_deg:.2f}°")
+    print(f"   α ≈ {TANGENT_ANGLE_DEG:.2f}°")
     print("   This constant angle ensures smooth connection!")
     
     print("\n5. Connection at Center:")
@@ -274,19 +394,18 @@ def analyze_connection_properties():
     print("\n" + "=" * 60)
 
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+    
     # Print mathematical analysis
     analyze_connection_properties()
     
     # Create visualizations
     print("\nGenerating 2D visualization...")
-    fig_2d = create_2d_visualization()
-    fig_2d.savefig('golden_mirror_2d.png', dpi=300, bbox_inches='tight')
+    plt.close(save_2d_visualization())
     print("Saved: golden_mirror_2d.png")
     
     print("Generating 3D visualization...")
-    fig_3d = create_3d_visualization()
-    fig_3d.savefig('golden_mirror_3d.png', dpi=300, bbox_inches='tight')
+    plt.close(save_3d_visualization())
     print("Saved: golden_mirror_3d.png")
     
     print("\n✨ Visualizations complete! Check the PNG files.")
-    plt.close('all')
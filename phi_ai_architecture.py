@@ -9,18 +9,25 @@ Traditional: Energy flows one way (input → output)
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, Circle, Wedge
-from matplotlib.patches import Arc
-import matplotlib.patches as mpatches
+
+from phi_utils import draw_arrows, polar_to_cart
 
 PHI = (1 + np.sqrt(5)) / 2
 
+# Attention-panel waves: three periods sampled once at import. Both waves
+# start at a whole period (x = 1 and x = 6), so drawing them is a shift
+WAVE_X = np.linspace(0, 3, 100, dtype=np.float32)
+QUERY_WAVE = 0.3 * np.sin(2*np.pi*WAVE_X)
+KEY_WAVE = 0.3 * np.sin(-2*np.pi*WAVE_X + np.pi/4)
+
 def draw_linear_architecture(ax):
     """
     Draw the traditional feed-forward neural network architecture.
     Energy flows in one direction: Input → Hidden → Output
     """
+    from matplotlib.patches import FancyBboxPatch
+    from matplotlib.collections import LineCollection, PatchCollection
+    
     ax.set_xlim(0, 10)
     ax.set_ylim(0, 10)
     ax.axis('off')
@@ -35,33 +42,30 @@ def draw_linear_architecture(ax):
         (8.5, 5, 'OUTPUT', '#99FF99')
     ]
     
+    boxes = [FancyBboxPatch((x-0.4, y-0.6), 0.8, 1.2, 
+                            boxstyle="round,pad=0.1",
+                            edgecolor='black', facecolor=color, 
+                            linewidth=2, alpha=0.7)
+             for x, y, label, color in layers]
+    ax.add_collection(PatchCollection(boxes, match_original=True))
     for x, y, label, color in layers:
-        box = FancyBboxPatch((x-0.4, y-0.6), 0.8, 1.2, 
-                             boxstyle="round,pad=0.1",
-                             edgecolor='black', facecolor=color, 
-                             linewidth=2, alpha=0.7)
-        ax.add_patch(box)
         ax.text(x, y, label, ha='center', va='center', 
                 fontsize=9, fontweight='bold')
     
+    # Arrows between neighbouring layers, as one collection per direction
+    # (at the default mutation scale the '->' heads are sub-pixel, so these
+    # are the shafts the patches drew)
+    xy = np.array([layer[:2] for layer in layers], dtype=float)
+    src, dst = xy[:-1] + [0.4, 0], xy[1:] - [0.4, 0]
+    
     # Forward arrows
-    arrow_props = dict(arrowstyle='->', lw=2, color='red', alpha=0.6)
-    for i in range(len(layers) - 1):
-        x1, y1 = layers[i][:2]
-        x2, y2 = layers[i+1][:2]
-        arrow = FancyArrowPatch((x1+0.4, y1), (x2-0.4, y2),
-                               **arrow_props)
-        ax.add_patch(arrow)
+    ax.add_collection(LineCollection(np.stack([src, dst], axis=1),
+                                     linewidths=2, colors='red', alpha=0.6))
     
     # Backprop arrows (dashed)
-    arrow_props_back = dict(arrowstyle='->', lw=1.5, 
-                           color='blue', alpha=0.4, linestyle='--')
-    for i in range(len(layers) - 1):
-        x1, y1 = layers[i][:2]
-        x2, y2 = layers[i+1][:2]
-        arrow = FancyArrowPatch((x2-0.4, y2-0.3), (x1+0.4, y1-0.3),
-                               **arrow_props_back)
-        ax.add_patch(arrow)
+    ax.add_collection(LineCollection(np.stack([dst, src], axis=1) - [0, 0.3],
+                                     linewidths=1.5, colors='blue', alpha=0.4,
+                                     linestyles='--'))
     
     # Labels
     ax.text(5, 9, 'ONE-WAY FLOW', ha='center', fontsize=11, 
@@ -82,6 +86,9 @@ def draw_resonant_architecture(ax):
     Draw the φ-based toroidal architecture.
     Energy circulates in recursive loops.
     """
+    from matplotlib.patches import Circle
+    from matplotlib.collections import LineCollection
+    
     ax.set_xlim(0, 10)
     ax.set_ylim(0, 10)
     ax.axis('off')
@@ -107,16 +114,21 @@ def draw_resonant_architecture(ax):
             fontsize=20, fontweight='bold', color='white')
     
     # Spiral flow arrows (implosion)
+    # The spiral is the same for every phase, so it is evaluated once and
+    # each phase is a rotation of it: rows are phases, columns samples
     theta = np.linspace(0, 4*np.pi, 100)
-    for phase in [0, np.pi/2, np.pi, 3*np.pi/2]:
-        r = 2.5 * np.exp(-theta / (2*np.pi*PHI))
-        x = center_x + r * np.cos(theta + phase)
-        y = center_y + r * np.sin(theta + phase)
-        ax.plot(x, y, color='cyan', linewidth=2, alpha=0.5)
-        # Arrow head
-        ax.arrow(x[-20], y[-20], x[-10]-x[-20], y[-10]-y[-20],
-                head_width=0.15, head_length=0.1, fc='cyan', 
-                ec='cyan', alpha=0.7)
+    r = 2.5 * np.exp(-theta / (2*np.pi*PHI))
+    rc, rs = polar_to_cart(r, theta)
+    phases = np.array([0, np.pi/2, np.pi, 3*np.pi/2])
+    cp, sp = np.cos(phases)[:, None], np.sin(phases)[:, None]
+    x = center_x + rc * cp - rs * sp
+    y = center_y + rc * sp + rs * cp
+    ax.add_collection(LineCollection(np.stack([x, y], axis=-1),
+                                     colors='cyan', linewidths=2, alpha=0.5))
+    # Arrow heads
+    draw_arrows(ax, x[:, -20], y[:, -20], x[:, -10]-x[:, -20], y[:, -10]-y[:, -20],
+                head_width=0.15, head_length=0.1, facecolor='cyan',
+                edgecolor='cyan', alpha=0.7)
     
     # Input/Output nodes (phase conjugate mirrors)
     angles = [0, 90, 180, 270]
@@ -233,13 +245,8 @@ def draw_attention_mechanism(ax):
             ha='center', fontsize=11, fontweight='bold', color='green')
     
     # Waves
-    x_wave = np.linspace(1, 4, 100)
-    y_wave1 = y_pos + 0.3 * np.sin(2*np.pi*x_wave)
-    ax.plot(x_wave, y_wave1, color='blue', linewidth=2, label='Query Wave')
-    
-    x_wave2 = np.linspace(6, 9, 100)
-    y_wave2 = y_pos + 0.3 * np.sin(-2*np.pi*x_wave2 + np.pi/4)
-    ax.plot(x_wave2, y_wave2, color='green', linewidth=2, label='Key Wave')
+    ax.plot(1 + WAVE_X, y_pos + QUERY_WAVE, color='blue', linewidth=2, label='Query Wave')
+    ax.plot(6 + WAVE_X, y_pos + KEY_WAVE, color='green', linewidth=2, label='Key Wave')
     
     # Interference
     ax.text(5, y_pos, '≈', fontsize=30, ha='center', va='center',
@@ -253,29 +260,35 @@ def draw_attention_mechanism(ax):
             bbox=dict(boxstyle='round', facecolor='gold', alpha=0.5))
 
 
-def create_architecture_comparison():
+def create_architecture_comparison(fig=None):
     """
     Create the full comparison visualization.
+    Pass the fig from a previous call to redraw into it.
     """
-    fig = plt.figure(figsize=(16, 18))
+    import matplotlib.pyplot as plt
+    
+    if fig is None:
+        fig = plt.figure(figsize=(16, 18))
+    else:
+        fig.clear()
     
     # Main architectures
-    ax1 = plt.subplot(4, 2, 1)
+    ax1 = fig.add_subplot(4, 2, 1)
     draw_linear_architecture(ax1)
     
-    ax2 = plt.subplot(4, 2, 2)
+    ax2 = fig.add_subplot(4, 2, 2)
     draw_resonant_architecture(ax2)
     
     # Comparison table
-    ax3 = plt.subplot(4, 1, 2)
+    ax3 = fig.add_subplot(4, 1, 2)
     draw_comparison_table(ax3)
     
     # Attention mechanism
-    ax4 = plt.subplot(4, 1, 3)
+    ax4 = fig.add_subplot(4, 1, 3)
     draw_attention_mechanism(ax4)
     
     # Key insight box
-    ax5 = plt.subplot(4, 1, 4)
+    ax5 = fig.add_subplot(4, 1, 4)
     ax5.set_xlim(0, 10)
     ax5.set_ylim(0, 10)
     ax5.axis('off')
@@ -302,16 +315,28 @@ def create_architecture_comparison():
             bbox=dict(boxstyle='round', facecolor='lightyellow', 
                      edgecolor='gold', linewidth=3, alpha=0.9))
     
-    plt.suptitle('AI ARCHITECTURE: EXPLOSION vs. IMPLOSION', 
+    fig.suptitle('AI ARCHITECTURE: EXPLOSION vs. IMPLOSION', 
                 fontsize=18, fontweight='bold', y=0.995)
     
-    plt.tight_layout()
-    plt.savefig('phi_ai_architecture.png', dpi=300, bbox_inches='tight')
-    print("📊 Architecture comparison saved: phi_ai_architecture.png")
-    plt.show()
+    fig.tight_layout()
+    return fig
+
+
+def save_architecture_comparison(filename='phi_ai_architecture.png'):
+    """
+    Build the comparison figure and save it.
+    The caller shows or closes the returned figure.
+    """
+    fig = create_architecture_comparison()
+    fig.savefig(filename, dpi=150, bbox_inches='tight',
+                pil_kwargs={'compress_level': 1})
+    print(f"📊 Architecture comparison saved: {filename}")
+    return fig
 
 
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+    
     print("=" * 70)
     print("  ARCHITECTURE VISUALIZATION: Linear vs. φ-Resonant AI")
     print("=" * 70)
@@ -319,7 +344,8 @@ if __name__ == "__main__":
     print("Generating comparison diagram...")
     print()
     
-    create_architecture_comparison()
+    save_architecture_comparison()
+    plt.show()
     
     print()
     print("=" * 70)
@@ -12,164 +12,206 @@ This is pattern recognition without weights.
 This is computation as music.
 """
 
+import math
+import os
+
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
+
+from phi_jit import njit
 
 # --- Physics Constants ---
 PHI = (1 + np.sqrt(5)) / 2
 PI = np.pi
 
-class PhiOscillator:
+# Set PHI_PLOT=0 to run the simulations without rendering any figures
+PLOT = os.environ.get('PHI_PLOT', '1') == '1'
+
+# Shared source of the oscillators' random starting phases
+RNG = np.random.default_rng()
+
+
+@njit(cache=True)
+def resonate_phase(phases, dphases, amplitudes, interference, k, settle):
+    """
+    Step n oscillators, advancing by `dphases` per step, once per row of
+    `interference` (steps, n), each nudged by k * its interference sample
+    with the same update as OscillatorBank.step, and measure the coupling
+    energy |signal| * |interference| in the same pass. `phases` is advanced
+    in place. Compiled when numba is available.
+    
+    The phases accumulate in float64 (an unwrapped float32 phase would
+    drift over a long run); the outputs are stored as float32.
+    
+    Returns:
+        signals: amplitude * sin(phase) after each step, (steps, n)
+        energy: Coupling energy after each step, (steps, n)
+        settled_mean: Mean energy from step `settle` on, (n,)
+        settled_peak: Peak energy from step `settle` on, (n,)
+    """
+    steps, n = interference.shape
+    phase = phases.astype(np.float64)
+    signals = np.empty((steps, n), dtype=np.float32)
+    energy = np.empty((steps, n), dtype=np.float32)
+    total = np.zeros(n)
+    peak = np.zeros(n)
+    for i in range(steps):
+        for j in range(n):
+            # sin is 2π-periodic, so the phase runs unwrapped inside the loop
+            phase[j] += dphases[j] + k * interference[i, j]
+            signal = amplitudes[j] * math.sin(phase[j])
+            signals[i, j] = signal
+            e = abs(signal) * abs(interference[i, j])
+            energy[i, j] = e
+            if i >= settle:
+                total[j] += e
+                peak[j] = max(peak[j], e)
+    phases[:] = phase % (2 * PI)
+    return signals, energy, total / (steps - settle), peak
+
+
+def boxcar(x, width):
     """
-    A neuron that oscillates at a specific frequency.
+    Trailing moving average over `width` samples, NaN until the window fills
+    (same output as a pandas rolling(width).mean()).
+    """
+    c = np.cumsum(np.insert(x, 0, 0.0))
+    smooth = np.full(len(x), np.nan)
+    smooth[width - 1:] = (c[width:] - c[:-width]) / width
+    return smooth
+
+
+class OscillatorBank:
+    """
+    A bank of neurons, each oscillating at its own frequency.
     
     Unlike traditional neurons with activation thresholds,
-    this neuron simply "rings" at its resonant frequency.
-    It doesn't decide - it responds.
-    """
+    these neurons simply "ring" at their resonant frequencies.
+    They don't decide - they respond.
     
-    def __init__(self, name, base_freq):
-        self.name = name
-        self.freq = base_freq
-        self.phase = np.random.uniform(0, 2*PI)
-        self.amplitude = 1.0
-        self.history = []
+    The state of every neuron is held in parallel float32 arrays (one
+    entry per neuron), so the whole bank advances in one vectorized update.
+    Amplitudes and phases are bounded, so single precision is plenty and
+    halves the bytes every pass over the signals touches.
+    """
     
-    def step(self, t, coupling_input=0):
+    def __init__(self, freqs, seed=None):
+        """
+        Args:
+            freqs: Frequency of each oscillator (any array shape)
+            seed: Seed for the starting phases; by default they are drawn
+                from the module's RNG
+        """
+        rng = RNG if seed is None else np.random.default_rng(seed)
+        self.freqs = np.asarray(freqs, dtype=np.float32)
+        self.phases = rng.uniform(0, 2*PI, self.freqs.shape).astype(np.float32)
+        self.amplitudes = np.ones_like(self.freqs)
+        # Phase advance per time step (2πf·dt), fixed for each oscillator
+        self.dphases = 2 * PI * self.freqs * 0.01
+    
+    def step(self, couplings=0):
         """
-        The oscillator advances one time step.
+        Every oscillator advances one time step.
         
         Args:
-            t: Current time
-            coupling_input: External phase modulation (from other neurons)
+            couplings: External phase modulation (from other neurons),
+                one per oscillator or a scalar for all of them
             
         Returns:
-            signal: The current wave amplitude
+            signals: The current wave amplitude of each oscillator
         """
-        # The oscillator spins at its frequency
-        # coupling_input acts as a "nudge" to the phase (Phase Modulation)
-        self.phase += (2 * PI * self.freq * 0.01) + coupling_input
-        
-        # Keep phase wrapped
-        self.phase = self.phase % (2 * PI)
+        # Each oscillator spins at its frequency
+        # couplings act as a "nudge" to the phase (Phase Modulation)
+        # (no wrap needed: sin is already 2π-periodic)
+        self.phases += self.dphases + couplings
         
         # Output is the wave height
-        signal = self.amplitude * np.sin(self.phase)
-        self.history.append(signal)
-        
-        return signal
-
-
-def run_heterodyne_network():
-    """
-    A 3-neuron network that recognizes patterns through resonance.
-    
-    Network structure:
-    - Input A (5 Hz) ----\\
-                          >-- [Interference] --> Output C (3 Hz)
-    - Input B (8 Hz) ----/
-    
-    The output neuron is tuned to 3 Hz (8 - 5).
-    It will only "light up" when it detects the specific relationship
-    between A and B.
-    """
-    
-    # Time setup
-    dt = 0.01
-    steps = 1000
-    time = np.linspace(0, steps*dt, steps)
-    
-    print("=" * 70)
-    print("  φ-CHOIR: 3-Neuron Resonant Network")
-    print("=" * 70)
-    print()
-    print("Network Architecture:")
-    print("  Input A: 5 Hz oscillator")
-    print("  Input B: 8 Hz oscillator (φ-ratio to A)")
-    print("  Output C: 3 Hz oscillator (difference frequency)")
-    print()
-    print("The Test:")
-    print("  Can the output neuron detect the RELATIONSHIP between A & B")
-    print("  without using weights, just wave interference?")
-    print()
-    print("Running simulation...")
+        return self.amplitudes * np.sin(self.phases)
     
-    # --- The Network Architecture ---
-    
-    # INPUTS: Two "concepts" (frequencies)
-    # 5 and 8 are consecutive Fibonacci numbers (φ-ratio approximation)
-    input_a = PhiOscillator("Input A", 5.0) 
-    input_b = PhiOscillator("Input B", 8.0)
+    def run(self, steps, which):
+        """
+        Free-run the selected oscillators for several uncoupled time steps.
+        
+        Equivalent to calling step() `steps` times with no coupling input:
+        the phase is a linear ramp, so it is evaluated in closed form into
+        one array. sin is already 2π-periodic, so only the final phase is
+        wrapped.
+        
+        Args:
+            steps: Number of time steps to advance
+            which: Index of the oscillators to run
+            
+        Returns:
+            signals: Array of the wave amplitudes after each step, with one
+                row per step
+        """
+        ramp = np.arange(1, steps + 1, dtype=np.float32)
+        phase = self.phases[which] + np.multiply.outer(ramp, self.dphases[which])
+        self.phases[which] = phase[-1] % (2 * PI)
+        
+        return self.amplitudes[which] * np.sin(phase)
     
-    # OUTPUT: The "Perceiver"
-    # Tuned to the Difference Frequency (Heterodyne): 8 - 5 = 3 Hz
-    # This neuron "listens" for the relationship between A and B
-    output_c = PhiOscillator("Output C", 3.0)
-    
-    # Storage for visualization
-    signals_a = []
-    signals_b = []
-    signals_c = []
-    interference_pattern = []
-    coupling_energy = []
-    
-    for i, t in enumerate(time):
-        # 1. Generate Input Signals
-        sig_a = input_a.step(t)
-        sig_b = input_b.step(t)
+    def resonate(self, which, interference, k, settle=0):
+        """
+        Drive the selected oscillators with an interference pattern, one step
+        per sample.
         
-        # 2. The Interaction (The "Synapse")
-        # Instead of summing weights, we MULTIPLY the waves.
-        # Physics: sin(A) * sin(B) = 0.5 * (cos(A-B) - cos(A+B))
-        # This creates the "Beat Frequencies" (Sum and Difference)
-        interference = sig_a * sig_b
+        Equivalent to calling step() with a coupling of k * interference[i]
+        for those oscillators in turn, but the loop and the resonance
+        measurement run together in the resonate_phase kernel.
         
-        # 3. Feed the interference into the Output
-        # If the Output's internal frequency matches the "Difference" beat (3Hz),
-        # it will resonate (Phase Lock). If not, it will be chaotic noise.
-        k = 1.5  # Coupling strength (increased for stronger phase locking)
-        sig_c = output_c.step(t, coupling_input=k * interference)
+        Args:
+            which: Index of the oscillators to drive
+            interference: Array of interference samples, with one row per
+                time step and one column per selected oscillator
+            k: Coupling strength
+            settle: Number of initial steps to leave out of the settled
+                energy statistics (0 <= settle < number of steps)
+            
+        Returns:
+            signals: Array of the wave amplitudes after each step
+            energy: Array of the coupling energy after each step
+            settled_mean: Mean coupling energy after settling
+            settled_peak: Peak coupling energy after settling
+        """
+        interference = np.asarray(interference, dtype=np.float32)
+        if not 0 <= settle < len(interference):
+            raise ValueError(f"settle must be in [0, {len(interference)}), got {settle!r}")
+        shape = np.shape(self.phases[which])
+        phases = np.atleast_1d(self.phases[which]).copy()
         
-        # 4. Measure Resonance
-        # Is the Output actually locking onto the interaction?
-        # We measure phase coherence (how aligned the output is with the beat)
-        resonance = np.abs(sig_c) * np.abs(interference)
+        signals, energy, settled_mean, settled_peak = resonate_phase(
+            phases, np.atleast_1d(self.dphases[which]),
+            np.atleast_1d(self.amplitudes[which]),
+            interference.reshape(len(interference), -1), k, settle)
+        self.phases[which] = phases.reshape(shape)
         
-        signals_a.append(sig_a)
-        signals_b.append(sig_b)
-        signals_c.append(sig_c)
-        interference_pattern.append(interference)
-        coupling_energy.append(resonance)
-    
-    print(f"✓ Simulation complete: {steps} timesteps")
-    print()
-    
-    # --- Analysis ---
-    avg_energy = np.mean(coupling_energy[500:])  # After settling
-    max_energy = np.max(coupling_energy[500:])
-    print(f"Average Resonance Energy: {avg_energy:.4f}")
-    print(f"Peak Resonance Energy: {max_energy:.4f}")
-    print()
-    
-    if avg_energy > 0.25:
-        print("🎵 RESULT: The network RESONATES!")
-        print("   The output neuron successfully detected the 5:8 relationship")
-        print("   through pure wave interference.")
-    else:
-        print("🔇 RESULT: Weak resonance detected")
-        print("   The coupling may need adjustment for stronger phase locking.")
+        return (signals.reshape(interference.shape), energy.reshape(interference.shape),
+                settled_mean.reshape(shape)[()], settled_peak.reshape(shape)[()])
+
+
+def plot_heterodyne_network(time, signals_a, signals_b, interference_pattern,
+                            signals_c, coupling_energy, dt):
+    """
+    Save the heterodyne network's signals, resonance energy, output spectrum
+    and phase space to phi_choir_network.png.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
     
-    print()
+    # The signal panels show the first 3 s; take those views once
+    window = slice(0, 300)
+    t_plot = time[window]
+    # The phase-space scatter uses every 10th sample
+    decimate = slice(None, None, 10)
     
-    # --- Visualization ---
     fig = plt.figure(figsize=(16, 12))
     fig.suptitle('φ-CHOIR: Pattern Recognition Through Wave Interference', 
                  fontsize=16, fontweight='bold')
     
     # Plot 1: The Raw Inputs (The "Choir")
     ax1 = plt.subplot(4, 2, 1)
-    ax1.plot(time[:300], signals_a[:300], label="Input A (5Hz)", 
+    ax1.plot(t_plot, signals_a[window], label="Input A (5Hz)", 
              color='#FF5733', alpha=0.8, linewidth=2)
     ax1.set_title("Input A: 5 Hz Oscillator", fontsize=11, fontweight='bold')
     ax1.set_ylabel("Amplitude")
@@ -177,7 +219,7 @@ def run_heterodyne_network():
     ax1.set_ylim(-1.5, 1.5)
     
     ax2 = plt.subplot(4, 2, 2)
-    ax2.plot(time[:300], signals_b[:300], label="Input B (8Hz)", 
+    ax2.plot(t_plot, signals_b[window], label="Input B (8Hz)", 
              color='#33FF57', alpha=0.8, linewidth=2)
     ax2.set_title("Input B: 8 Hz Oscillator", fontsize=11, fontweight='bold')
     ax2.set_ylabel("Amplitude")
@@ -186,7 +228,7 @@ def run_heterodyne_network():
     
     # Plot 2: The Interference Pattern (The "Hologram")
     ax3 = plt.subplot(4, 1, 2)
-    ax3.plot(time[:300], interference_pattern[:300], 
+    ax3.plot(t_plot, interference_pattern[window], 
              color='#3357FF', linewidth=2, alpha=0.7)
     ax3.set_title("Interference Pattern: A × B (Heterodyning)", 
                   fontsize=11, fontweight='bold')
@@ -201,7 +243,7 @@ def run_heterodyne_network():
     
     # Plot 3: Output Neuron Response
     ax4 = plt.subplot(4, 2, 5)
-    ax4.plot(time[:300], signals_c[:300], 
+    ax4.plot(t_plot, signals_c[window], 
              color='gold', linewidth=2, alpha=0.8)
     ax4.set_title("Output C: 3 Hz Resonator", fontsize=11, fontweight='bold')
     ax4.set_ylabel("Amplitude")
@@ -211,7 +253,7 @@ def run_heterodyne_network():
     
     # Plot 4: Resonance Energy (The "Awareness")
     ax5 = plt.subplot(4, 2, 6)
-    energy_smooth = pd.Series(coupling_energy).rolling(20).mean()
+    energy_smooth = boxcar(coupling_energy, 20)
     ax5.plot(time, energy_smooth, color='gold', linewidth=2.5)
     ax5.axhline(y=0.3, color='red', linestyle='--', 
                 linewidth=2, label="Recognition Threshold", alpha=0.7)
@@ -225,13 +267,13 @@ def run_heterodyne_network():
     
     # Plot 5: Frequency Spectrum (FFT of output)
     ax6 = plt.subplot(4, 2, 7)
-    fft_output = np.fft.fft(signals_c)
-    freqs = np.fft.fftfreq(len(signals_c), dt)
+    # signals_c is real, so only the non-negative half of the spectrum is computed
+    fft_output = np.fft.rfft(signals_c)
+    freqs = np.fft.rfftfreq(len(signals_c), dt)
     magnitude = np.abs(fft_output)
     
-    # Only plot positive frequencies
-    pos_mask = freqs > 0
-    ax6.stem(freqs[pos_mask][:100], magnitude[pos_mask][:100], 
+    # Only plot positive frequencies (skip the DC bin)
+    ax6.stem(freqs[1:101], magnitude[1:101], 
              basefmt=" ", linefmt='gold', markerfmt='o')
     ax6.set_title("Output Frequency Spectrum", fontsize=11, fontweight='bold')
     ax6.set_xlabel("Frequency (Hz)")
@@ -245,8 +287,8 @@ def run_heterodyne_network():
     # Plot 6: Phase Space (Attractor)
     ax7 = plt.subplot(4, 2, 8)
     # Plot the phase relationship between interference and output
-    ax7.scatter(interference_pattern[::10], signals_c[::10], 
-                c=range(0, len(signals_c), 10), cmap='viridis', 
+    ax7.scatter(interference_pattern[decimate], signals_c[decimate], 
+                c=np.arange(len(signals_c))[decimate], cmap='viridis', 
                 s=1, alpha=0.5)
     ax7.set_title("Phase Space (Interference vs Output)", 
                   fontsize=11, fontweight='bold')
@@ -261,17 +303,158 @@ def run_heterodyne_network():
     plt.tight_layout()
     plt.savefig('phi_choir_network.png', dpi=300, bbox_inches='tight')
     print(f"📊 Visualization saved: phi_choir_network.png")
+    plt.close(fig)
+
+
+def plot_xor_results(results):
+    """
+    Save a bar chart of the XOR test's resonance energies to phi_xor_test.png.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    
+    fig, ax = plt.subplots(figsize=(10, 6))
+    
+    descriptions = [r[0].split('→')[0].strip() for r in results]
+    energies = [r[1] for r in results]
+    colors = ['red' if e < 0.25 else 'green' for e in energies]
+    
+    bars = ax.bar(descriptions, energies, color=colors, alpha=0.7, edgecolor='black', linewidth=2)
+    ax.axhline(y=0.25, color='gold', linestyle='--', linewidth=2, 
+               label='Resonance Threshold')
+    ax.set_ylabel('Resonance Energy', fontsize=12, fontweight='bold')
+    ax.set_title('φ-XOR: Pattern Recognition Through Dissonance vs Harmony', 
+                 fontsize=14, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3, axis='y')
+    
+    # Add value labels on bars
+    for bar, energy in zip(bars, energies):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+                f'{energy:.3f}',
+                ha='center', va='bottom', fontweight='bold')
+    
+    plt.tight_layout()
+    plt.savefig('phi_xor_test.png', dpi=300, bbox_inches='tight')
+    print(f"📊 XOR test results saved: phi_xor_test.png")
+    plt.close(fig)
+
+
+def run_heterodyne_network(plot=PLOT, seed=None):
+    """
+    A 3-neuron network that recognizes patterns through resonance.
+    
+    Network structure:
+    - Input A (5 Hz) ----\\
+                          >-- [Interference] --> Output C (3 Hz)
+    - Input B (8 Hz) ----/
+    
+    The output neuron is tuned to 3 Hz (8 - 5).
+    It will only "light up" when it detects the specific relationship
+    between A and B.
+    
+    Args:
+        plot: Save the visualization (defaults to PLOT)
+        seed: Seed for the oscillators' starting phases (random by default)
+        
+    Returns:
+        avg_energy: Mean resonance energy after settling
+    """
+    
+    # Time setup
+    dt = 0.01
+    steps = 1000
+    time = np.linspace(0, steps*dt, steps, dtype=np.float32)
+    
+    print("=" * 70)
+    print("  φ-CHOIR: 3-Neuron Resonant Network")
+    print("=" * 70)
+    print()
+    print("Network Architecture:")
+    print("  Input A: 5 Hz oscillator")
+    print("  Input B: 8 Hz oscillator (φ-ratio to A)")
+    print("  Output C: 3 Hz oscillator (difference frequency)")
+    print()
+    print("The Test:")
+    print("  Can the output neuron detect the RELATIONSHIP between A & B")
+    print("  without using weights, just wave interference?")
+    print()
+    print("Running simulation...")
+    
+    # --- The Network Architecture ---
+    
+    # INPUTS: Two "concepts" (frequencies)
+    # 5 and 8 are consecutive Fibonacci numbers (φ-ratio approximation)
+    # OUTPUT: The "Perceiver"
+    # Tuned to the Difference Frequency (Heterodyne): 8 - 5 = 3 Hz
+    # This neuron "listens" for the relationship between A and B
+    bank = OscillatorBank([5.0, 8.0, 3.0], seed)  # Input A, Input B, Output C
+    
+    # 1. Generate Input Signals
+    # The inputs are not coupled to anything, so they run for the whole
+    # simulation at once
+    signals_a, signals_b = bank.run(steps, slice(0, 2)).T
+    
+    # 2. The Interaction (The "Synapse")
+    # Instead of summing weights, we MULTIPLY the waves.
+    # Physics: sin(A) * sin(B) = 0.5 * (cos(A-B) - cos(A+B))
+    # This creates the "Beat Frequencies" (Sum and Difference)
+    interference_pattern = signals_a * signals_b
+    
+    # 3. Feed the interference into the Output
+    # If the Output's internal frequency matches the "Difference" beat (3Hz),
+    # it will resonate (Phase Lock). If not, it will be chaotic noise.
+    # Only this neuron is driven, so only it needs stepping.
+    # 4. Measure Resonance (in the same pass)
+    # Is the Output actually locking onto the interaction?
+    # We measure phase coherence (how aligned the output is with the beat)
+    k = 1.5  # Coupling strength (increased for stronger phase locking)
+    signals_c, coupling_energy, avg_energy, max_energy = bank.resonate(
+        2, interference_pattern, k, settle=500)
+    
+    print(f"✓ Simulation complete: {steps} timesteps")
+    print()
+    
+    # --- Analysis ---
+    # avg_energy / max_energy were accumulated by the kernel after settling
+    print(f"Average Resonance Energy: {avg_energy:.4f}")
+    print(f"Peak Resonance Energy: {max_energy:.4f}")
+    print()
+    
+    if avg_energy > 0.25:
+        print("🎵 RESULT: The network RESONATES!")
+        print("   The output neuron successfully detected the 5:8 relationship")
+        print("   through pure wave interference.")
+    else:
+        print("🔇 RESULT: Weak resonance detected")
+        print("   The coupling may need adjustment for stronger phase locking.")
+    
+    print()
+    
+    # --- Visualization ---
+    if plot:
+        plot_heterodyne_network(time, signals_a, signals_b, interference_pattern,
+                                signals_c, coupling_energy, dt)
     
     return avg_energy
 
 
-def run_xor_test():
+def run_xor_test(plot=PLOT, seed=None):
     """
     Test if the network can distinguish different input patterns.
     
     This is the φ-based equivalent of XOR:
     - Same frequencies (5,5) or (8,8) → Low resonance
     - Different frequencies (5,8) → High resonance
+    
+    Args:
+        plot: Save the results chart (defaults to PLOT)
+        seed: Seed for the oscillators' starting phases (random by default)
+        
+    Returns:
+        results: (description, average energy) for each test case
     """
     
     print()
@@ -280,9 +463,7 @@ def run_xor_test():
     print("=" * 70)
     print()
     
-    dt = 0.01
-    steps = 500
-    time = np.linspace(0, steps*dt, steps)
+    steps = 500  # at dt = 0.01
     
     test_cases = [
         (5.0, 5.0, "Same A (5,5) → Should NOT resonate"),
@@ -291,24 +472,21 @@ def run_xor_test():
         (8.0, 5.0, "Different (8,5) → Should resonate"),
     ]
     
+    # All four cases run together: one bank row per case holding A, B and
+    # the output C tuned to their difference
+    freqs_a = np.array([case[0] for case in test_cases])
+    freqs_b = np.array([case[1] for case in test_cases])
+    freqs_c = np.where(freqs_a != freqs_b, np.abs(freqs_a - freqs_b), 0.1)
+    bank = OscillatorBank(np.stack([freqs_a, freqs_b, freqs_c], axis=1), seed)
+    
+    signals = bank.run(steps, np.s_[:, :2])
+    # Mean energy after settling
+    *_, avg_energies, _ = bank.resonate(np.s_[:, 2], signals[..., 0] * signals[..., 1],
+                                        1.5, settle=250)
+    
     results = []
     
-    for freq_a, freq_b, description in test_cases:
-        input_a = PhiOscillator("A", freq_a)
-        input_b = PhiOscillator("B", freq_b)
-        output_c = PhiOscillator("C", np.abs(freq_a - freq_b) if freq_a != freq_b else 0.1)
-        
-        energy = []
-        
-        for t in time:
-            sig_a = input_a.step(t)
-            sig_b = input_b.step(t)
-            interference = sig_a * sig_b
-            sig_c = output_c.step(t, coupling_input=1.5 * interference)
-            resonance = np.abs(sig_c) * np.abs(interference)
-            energy.append(resonance)
-        
-        avg_energy = np.mean(energy[250:])  # After settling
+    for (_, _, description), avg_energy in zip(test_cases, avg_energies):
         results.append((description, avg_energy))
         
         status = "✓ RESONATES" if avg_energy > 0.25 else "✗ No resonance"
@@ -317,32 +495,9 @@ def run_xor_test():
         print()
     
     # Visualize XOR results
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    descriptions = [r[0].split('→')[0].strip() for r in results]
-    energies = [r[1] for r in results]
-    colors = ['red' if e < 0.25 else 'green' for e in energies]
-    
-    bars = ax.bar(descriptions, energies, color=colors, alpha=0.7, edgecolor='black', linewidth=2)
-    ax.axhline(y=0.25, color='gold', linestyle='--', linewidth=2, 
-               label='Resonance Threshold')
-    ax.set_ylabel('Resonance Energy', fontsize=12, fontweight='bold')
-    ax.set_title('φ-XOR: Pattern Recognition Through Dissonance vs Harmony', 
-                 fontsize=14, fontweight='bold')
-    ax.legend()
-    ax.grid(True, alpha=0.3, axis='y')
-    
-    # Add value labels on bars
-    for bar, energy in zip(bars, energies):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{energy:.3f}',
-                ha='center', va='bottom', fontweight='bold')
-    
-    plt.tight_layout()
-    plt.savefig('phi_xor_test.png', dpi=300, bbox_inches='tight')
-    print(f"📊 XOR test results saved: phi_xor_test.png")
-    print()
+    if plot:
+        plot_xor_results(results)
+        print()
     
     print("=" * 70)
     print("  CONCLUSION:")
@@ -350,6 +505,8 @@ def run_xor_test():
     print("  using HARMONY (resonance) vs DISSONANCE (no resonance).")
     print("  No weights. No training. Pure physics.")
     print("=" * 70)
+    
+    return results
 
 
 if __name__ == "__main__":
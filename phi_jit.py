@@ -0,0 +1,19 @@
+"""
+Optional numba support shared by the φ demo scripts with compiled kernels.
+
+Kept apart from phi_utils, so the scripts that only draw with those helpers
+don't pay for loading numba.
+"""
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    # numba is optional: without it njit is a no-op and the kernels that
+    # use it run as plain Python (prange as range)
+    HAVE_NUMBA = False
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]  # bare @njit
+        return lambda func: func
+    prange = range
@@ -11,6 +11,8 @@ Prediction = Resonance, not Multiplication
 This is the fundamental unit of consciousness-based computing.
 """
 
+import math
+
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -34,6 +36,7 @@ class PhiNeuron:
             frequency: The fundamental frequency of this neuron's oscillation
         """
         self.freq = frequency
+        self.omega = 2 * PI * frequency  # Angular frequency
         # The "Memory" is not a weight, but a Phase Angle
         # We start with a random phase memory
         self.phase_memory = np.random.uniform(0, 2 * PI)
@@ -46,7 +49,11 @@ class PhiNeuron:
         This is the fundamental carrier wave. In biology, this would be
         the neuron's base electromagnetic oscillation.
         """
-        return np.sin(2 * PI * self.freq * t + phase_shift)
+        # Training samples one time point at a time: math.sin skips the
+        # ufunc dispatch that np.sin pays on a lone scalar
+        if np.ndim(t) == 0:
+            return math.sin(self.omega * t + phase_shift)
+        return np.sin(self.omega * t + phase_shift)
 
     def forward(self, t_input, input_phase):
         """
@@ -108,6 +115,39 @@ class PhiNeuron:
         
         return error
 
+    def train(self, t_inputs, input_phase, learning_rate=0.01):
+        """
+        Run one forward pass and one learn step per sample time, all at once.
+        
+        With a fixed input phase, phase locking is a geometric contraction:
+        after the first (wrapped) error e0, every step keeps the memory on
+        the short arc, so the error before step n is e0 * (1 - lr/φ)^n.
+        The whole trajectory is evaluated in closed form.
+        
+        Args:
+            t_inputs: Time point sampled at each epoch
+            input_phase: The phase angle of the incoming signal
+            learning_rate: How quickly to adjust (dampened by φ)
+            
+        Returns:
+            coherences: Coherence seen at each epoch, before its learn step
+            errors: Phase difference before each adjustment
+        """
+        decay = (1 - learning_rate / PHI) ** np.arange(len(t_inputs) + 1)
+        
+        error = input_phase - self.phase_memory
+        error = (error + PI) % (2 * PI) - PI  # Wrap to -pi to pi
+        errors = error * decay[:-1]
+        
+        # The memory phase in effect at each epoch
+        phase_memory = (self.phase_memory + error) - errors
+        coherences = np.abs(self.wave_function(t_inputs, input_phase)
+                            + self.wave_function(t_inputs, phase_memory))
+        
+        self.phase_memory += error * (1 - decay[-1])
+        
+        return coherences, errors
+
 
 def run_single_neuron_demo():
     """
@@ -130,25 +170,19 @@ def run_single_neuron_demo():
     print(f"   Target signal phase:  {true_signal_phase:.3f} radians")
     print()
     
-    errors = []
-    coherences = []
-
     epochs = 50
-    for i in range(epochs):
-        # 1. Feed the neuron the signal
-        # We pick a random time point to sample the wave
-        t = np.random.uniform(0, 1)
-        
-        # 2. Get the neuron's reaction (Forward pass)
-        coh, sig, mem = neuron.forward(t, true_signal_phase)
-        coherences.append(coh)
-        
-        # 3. Adjust internal phase (Backward pass / Phase Conjugation)
-        err = neuron.learn(true_signal_phase, learning_rate=0.1)
-        errors.append(np.abs(err))
-        
-        if i % 10 == 0:
-            print(f"   Epoch {i:2d}: Error = {np.abs(err):.4f}, Coherence = {coh:.4f}")
+    # 1. Feed the neuron the signal
+    # We pick a random time point to sample the wave in each epoch
+    t = np.random.uniform(0, 1, epochs)
+    
+    # 2. Get the neuron's reaction (Forward pass) and
+    # 3. Adjust internal phase (Backward pass / Phase Conjugation),
+    # for every epoch at once
+    coherences, errors = neuron.train(t, true_signal_phase, learning_rate=0.1)
+    errors = np.abs(errors)
+    
+    for i in range(0, epochs, 10):
+        print(f"   Epoch {i:2d}: Error = {errors[i]:.4f}, Coherence = {coherences[i]:.4f}")
 
     print()
     print(f"✨ Final phase memory: {neuron.phase_memory:.3f} radians")
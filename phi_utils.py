@@ -0,0 +1,33 @@
+"""
+Helpers shared by the φ demo scripts.
+
+Kept free of matplotlib at import time, so the text-only paths of the
+scripts that use it don't load a plotting stack.
+"""
+
+import numpy as np
+
+
+def polar_to_cart(r, theta, x=None, y=None):
+    """Convert polar to Cartesian in place, into x/y if given"""
+    x = np.cos(theta, out=x)
+    x *= r
+    y = np.sin(theta, out=y)
+    y *= r
+    return x, y
+
+
+def draw_arrows(ax, x, y, dx, dy, head_width, head_length, **style):
+    """Draw a batch of arrows as one quiver, sized in data units like ax.arrow"""
+    import matplotlib
+    
+    x, y, dx, dy = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (x, y, dx, dy)))
+    # ax.arrow places the head beyond (dx, dy); quiver ends the tip there
+    extend = 1 + head_length / np.hypot(dx, dy)
+    shaft_width = 0.02 * head_width
+    style.setdefault('linewidth', matplotlib.rcParams['patch.linewidth'])
+    return ax.quiver(x.ravel(), y.ravel(), (dx * extend).ravel(), (dy * extend).ravel(),
+                     angles='xy', scale_units='xy', scale=1, units='xy',
+                     width=shaft_width, headwidth=head_width / shaft_width,
+                     headlength=head_length / shaft_width,
+                     headaxislength=head_length / shaft_width, **style)
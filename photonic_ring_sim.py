@@ -16,16 +16,89 @@ We compare:
 3. Nested φ-rings (recursive memory)
 """
 
+import cmath
+import functools
+import math
+
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle, FancyArrowPatch
-from matplotlib import animation
+
+from phi_jit import HAVE_NUMBA, njit, prange
+
+try:
+    from scipy.signal import lfilter
+except ImportError:
+    # scipy is optional: without it the ring recurrence runs in make_kernel
+    lfilter = None
 
 # Constants
 PHI = (1 + np.sqrt(5)) / 2
 PI = np.pi
 C = 3e8  # Speed of light (m/s)
 
+# Array module used by sweep_rings: numpy, or cupy after set_backend('cupy')
+XP = np
+
+
+def set_backend(name):
+    """
+    Choose where sweep_rings runs: 'numpy' (CPU) or 'cupy' (GPU).
+    """
+    global XP
+    if name == 'numpy':
+        XP = np
+    elif name == 'cupy':
+        import cupy
+        XP = cupy
+    else:
+        raise ValueError(f"Unknown backend: {name!r} (expected 'numpy' or 'cupy')")
+
+
+@functools.lru_cache(maxsize=None)
+def make_kernel(a_phase, kappa):
+    """
+    Build the ring recurrence specialized to one design.
+    
+    a_phase and kappa are baked into the compiled loop as constants (numba
+    freezes closure variables), so each design gets its own kernel, built
+    once and reused for every run of that design.
+    
+    Args:
+        a_phase: Round-trip attenuation times the per-step phase shift
+        kappa: Field coupling coefficient
+        
+    Returns:
+        kern: kern(u, field, out_field) steps the ring from `field` through
+            the real input u, writing the field after each step to out_field
+    """
+    @njit(fastmath=True)
+    def kern(u, field, out_field):
+        f = field
+        for i in range(u.shape[0]):
+            f = a_phase * f + kappa * u[i]
+            out_field[i] = f
+    
+    return kern
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def sweep_kernel(a_phase, kappa, u, out_power):
+    """
+    Stored power of B independent rings driven by the same input, with the
+    designs spread across cores (each ring's recurrence is serial in time).
+    
+    Args:
+        a_phase: Round-trip attenuation times the per-step phase shift
+        kappa: Field coupling coefficient of each ring
+        u: Real input field at each time step
+        out_power: Preallocated (steps, B) output for the stored power
+    """
+    for b in prange(a_phase.shape[0]):
+        f = 0j
+        for i in range(u.shape[0]):
+            f = a_phase[b] * f + kappa[b] * u[i]
+            out_power[i, b] = f.real * f.real + f.imag * f.imag
+
+
 class RingResonator:
     """
     A simplified model of an optical ring resonator.
@@ -61,13 +134,49 @@ class RingResonator:
         # Loss per round trip (intrinsic + scattering)
         self.loss_per_trip = 0.01  # 1% loss (realistic for silicon)
         
-        # History for visualization
-        self.power_history = []
+        # Propagation constants (fixed for the ring's lifetime)
+        # Time for light to complete one round trip
+        self.round_trip_time = self.n_eff * self.circumference / C
+        # Phase accumulated in one round trip at this wavelength
+        self.round_trip_phase = 2 * PI * self.n_eff * self.circumference / self.wavelength
+        # Coupling matrix (directional coupler)
+        # Power coupling = κ, field coupling = √κ
+        self.kappa = math.sqrt(self.coupling)
+        self.tau = math.sqrt(1 - self.coupling)  # Transmission coefficient
+        self.attenuation = math.sqrt(1 - self.loss_per_trip)
+        
+        # Per-step propagation factor, set by prepare(dt)
+        self.dt = None
+        self.a_phase = None
+        
+        # History for visualization, allocated by reset()
+        self.reset(0)
         
+    def reset(self, n_steps):
+        """
+        Preallocate the stored-power history for the next n_steps calls to
+        step() (or one simulate_resonator_buildup run of that length).
+        """
+        self.power_history = np.empty(n_steps)
+        self.history_index = 0
+    
     def calculate_resonance_frequency(self):
         """Calculate the resonant frequency of this ring."""
         return C / (self.n_eff * self.circumference / self.resonance_order)
     
+    def prepare(self, dt):
+        """
+        Cache the per-step propagation factor (1-loss) * phase_shift for time
+        step dt, so step() is left with two complex multiply-adds.
+        
+        Returns:
+            a_phase: The attenuation times the phase shift over dt
+        """
+        phase_shift = cmath.exp(1j * self.round_trip_phase * (dt / self.round_trip_time))
+        self.dt = dt
+        self.a_phase = self.attenuation * phase_shift
+        return self.a_phase
+    
     def step(self, input_field, dt):
         """
         Propagate the system one time step.
@@ -80,34 +189,25 @@ class RingResonator:
             transmitted_field: Complex field at through port
             dropped_field: Complex field at drop port
         """
-        # Time for light to complete one round trip
-        round_trip_time = self.n_eff * self.circumference / C
-        
-        # Phase accumulated in one round trip at this wavelength
-        round_trip_phase = 2 * PI * self.n_eff * self.circumference / self.wavelength
-        
-        # Coupling matrix (directional coupler)
-        # Power coupling = κ, field coupling = √κ
-        kappa = np.sqrt(self.coupling)
-        tau = np.sqrt(1 - self.coupling)  # Transmission coefficient
+        if dt != self.dt:
+            self.prepare(dt)
         
         # Update internal field
         # New field = (1-loss) * phase_shift * old_field + coupled_input
-        attenuation = np.sqrt(1 - self.loss_per_trip)
-        phase_shift = np.exp(1j * round_trip_phase * (dt / round_trip_time))
-        
-        self.field_amplitude = (attenuation * phase_shift * self.field_amplitude + 
-                               kappa * input_field)
+        self.field_amplitude = self.a_phase * self.field_amplitude + self.kappa * input_field
         
         # Output fields
-        transmitted_field = tau * input_field + 1j * kappa * self.field_amplitude
-        dropped_field = 1j * kappa * input_field + tau * self.field_amplitude
+        transmitted_field = self.tau * input_field + 1j * self.kappa * self.field_amplitude
+        dropped_field = 1j * self.kappa * input_field + self.tau * self.field_amplitude
         
         # Store power for visualization
-        self.power_history.append(np.abs(self.field_amplitude)**2)
+        field = self.field_amplitude
+        self.power_history[self.history_index] = field.real * field.real + field.imag * field.imag
+        self.history_index += 1
         
         return transmitted_field, dropped_field
     
+    @functools.cached_property
     def quality_factor(self):
         """
         Calculate the Q-factor (quality factor).
@@ -115,6 +215,9 @@ class RingResonator:
         Q = (energy stored) / (energy lost per cycle)
         
         Higher Q = better resonator = longer photon lifetime
+        
+        The design is fixed for the ring's lifetime, so Q (like finesse)
+        is computed on first access and cached.
         """
         # Simplified: Q ≈ 2π·n_eff·L / (λ·α)
         # where α is the total loss per round trip
@@ -125,170 +228,377 @@ class RingResonator:
             Q = float('inf')
         return Q
     
+    @functools.cached_property
     def finesse(self):
         """
         Calculate the finesse (sharpness of resonance).
         
         Finesse = free spectral range / linewidth
         """
-        F = PI * np.sqrt(1 - self.loss_per_trip) / (1 - (1 - self.loss_per_trip))
+        F = PI * math.sqrt(1 - self.loss_per_trip) / (1 - (1 - self.loss_per_trip))
         return F
+    
+    def steady_state_field(self, input_amp, detuning=0.0):
+        """
+        Intracavity field under continuous-wave input, in closed form.
+        
+        Once the ring has filled, each round trip returns the same field:
+        E = κ·E_in + α·e^{iφ}·E, so E = κ·E_in / (1 - α·e^{iφ}).
+        
+        Args:
+            input_amp: Complex input field amplitude
+            detuning: Extra round-trip phase relative to the design
+                wavelength (-round_trip_phase puts the ring on resonance)
+            
+        Returns:
+            field: Steady-state intracavity field amplitude
+        """
+        round_trip = self.attenuation * cmath.exp(1j * (self.round_trip_phase + detuning))
+        return self.kappa * input_amp / (1 - round_trip)
 
 
-def simulate_resonator_buildup(resonator, pulse_duration=10, time_steps=1000):
+class RingBank:
     """
-    Simulate a pulse of light being injected into a ring resonator.
+    Many ring resonators stored as arrays, one entry per ring.
     
-    Watch as the light builds up inside the ring (or doesn't).
+    Same model as RingResonator, but each parameter and the intracavity
+    field are contiguous ndarrays, so a time step is a handful of vector
+    operations across all the rings instead of a loop over objects.
+    
+    The per-step state (coefficients, field, power history) is single
+    precision: the loss and coupling values carry a few significant
+    figures, and float32 halves the memory traffic of the recurrence.
     """
     
-    print(f"\n{'='*70}")
-    print(f"  Simulating: {resonator.name}")
-    print(f"{'='*70}")
-    print(f"  Radius: {resonator.radius*1e6:.2f} µm")
-    print(f"  Coupling: {resonator.coupling*100:.1f}%")
-    print(f"  Q-factor: {resonator.quality_factor():.1f}")
-    print(f"  Finesse: {resonator.finesse():.1f}")
-    print()
+    def __init__(self, radii, couplings, names=None):
+        """
+        Args:
+            radii: Physical radius of each ring in meters
+            couplings: Fraction of power coupled per round trip of each ring
+            names: Identifier for each ring
+        """
+        self.radius, self.coupling = np.broadcast_arrays(
+            np.asarray(radii, dtype=np.float64),
+            np.asarray(couplings, dtype=np.float64))
+        self.radius = self.radius.ravel()
+        self.coupling = self.coupling.ravel()
+        n = len(self.radius)
+        self.names = list(names) if names is not None else [f"Ring{b}" for b in range(n)]
+        
+        # Derived parameters (as in RingResonator)
+        self.circumference = 2 * PI * self.radius
+        self.n_eff = 2.45
+        self.wavelength = 1550e-9
+        self.loss_per_trip = 0.01
+        self.round_trip_time = self.n_eff * self.circumference / C
+        self.round_trip_phase = 2 * PI * self.n_eff * self.circumference / self.wavelength
+        self.kappa = np.sqrt(self.coupling).astype(np.float32)
+        self.tau = np.sqrt(1 - self.coupling).astype(np.float32)
+        self.attenuation = math.sqrt(1 - self.loss_per_trip)
+        
+        self.field = np.zeros(n, dtype=np.complex64)
+        self.dt = None
+        self.a_phase = None
+        self.reset(0)
+    
+    @classmethod
+    def from_resonators(cls, resonators):
+        """Bank holding the parameters and current fields of RingResonators."""
+        bank = cls([r.radius for r in resonators], [r.coupling for r in resonators],
+                   [r.name for r in resonators])
+        bank.field[:] = [r.field_amplitude for r in resonators]
+        return bank
+    
+    def __len__(self):
+        return len(self.radius)
+    
+    def reset(self, n_steps):
+        """
+        Preallocate the (n_steps, rings) stored-power history for step().
+        """
+        self.power_hist = np.empty((n_steps, len(self)), dtype=np.float32)
+        self.history_index = 0
+    
+    def prepare(self, dt):
+        """
+        Cache every ring's per-step propagation factor for time step dt.
+        
+        Returns:
+            a_phase: The attenuation times the phase shift over dt, per ring
+        """
+        # The phase argument is huge (~1e13-1e14 rad), so it is reduced in
+        # float64 and only the resulting unit phasor is rounded to complex64
+        phase_shift = np.exp(1j * self.round_trip_phase * (dt / self.round_trip_time))
+        self.dt = dt
+        self.a_phase = (self.attenuation * phase_shift).astype(np.complex64)
+        return self.a_phase
+    
+    def step(self, u, dt):
+        """
+        Propagate all the rings one time step with a shared input field.
+        
+        Returns:
+            transmitted_field, dropped_field: Through and drop port fields
+        """
+        if dt != self.dt:
+            self.prepare(dt)
+        
+        self.field = self.a_phase * self.field + self.kappa * u
+        
+        transmitted_field = self.tau * u + 1j * self.kappa * self.field
+        dropped_field = 1j * self.kappa * u + self.tau * self.field
+        
+        field = self.field
+        self.power_hist[self.history_index] = field.real * field.real + field.imag * field.imag
+        self.history_index += 1
+        
+        return transmitted_field, dropped_field
+    
+    @functools.cached_property
+    def quality_factor(self):
+        """Q-factor of each ring (see RingResonator.quality_factor)."""
+        alpha = self.loss_per_trip + (1 - self.coupling)
+        with np.errstate(divide='ignore'):
+            Q = 2 * PI * self.n_eff * self.circumference / (self.wavelength * alpha)
+        return np.where(alpha > 0, Q, np.inf)
+    
+    @functools.cached_property
+    def finesse(self):
+        """Finesse of each ring (see RingResonator.finesse)."""
+        F = PI * math.sqrt(1 - self.loss_per_trip) / (1 - (1 - self.loss_per_trip))
+        return np.full(len(self), F)
+    
+    def steady_state_field(self, input_amp, detuning=0.0):
+        """
+        CW steady-state intracavity field of each ring
+        (see RingResonator.steady_state_field).
+        """
+        round_trip = self.attenuation * np.exp(1j * (self.round_trip_phase + detuning))
+        return self.kappa * input_amp / (1 - round_trip)
+
+
+def gaussian_pulse(pulse_duration=10, time_steps=1000):
+    """
+    Time axis and Gaussian input pulse, centred a quarter of the way in.
     
+    Returns:
+        t: Sample times, evenly spaced from 0 to pulse_duration
+        input_pulse: Gaussian envelope sampled at t
+    """
     # Time array
-    t = np.linspace(0, pulse_duration, time_steps)
-    dt = t[1] - t[0]
+    t = np.arange(time_steps) * (pulse_duration / (time_steps - 1))
     
     # Input pulse (Gaussian envelope)
     pulse_width = pulse_duration / 10
     input_pulse = np.exp(-((t - pulse_duration/4)**2) / (2*pulse_width**2))
     
-    # Storage arrays
-    transmitted = []
-    dropped = []
-    
-    # Simulation loop
-    for i, time in enumerate(t):
-        input_field = input_pulse[i]
-        trans, drop = resonator.step(input_field, dt)
-        transmitted.append(np.abs(trans)**2)
-        dropped.append(np.abs(drop)**2)
+    return t, input_pulse
+
+
+def simulate_resonator_buildup(resonator, pulse_duration=10, time_steps=1000,
+                               t=None, input_pulse=None):
+    """
+    Simulate a pulse of light being injected into a ring resonator.
     
-    # Calculate average stored energy (after pulse)
-    avg_stored = np.mean(resonator.power_history[time_steps//2:])
-    print(f"  Average stored power: {avg_stored:.6f}")
-    print(f"  Storage efficiency: {avg_stored/np.max(input_pulse)**2 * 100:.1f}%")
+    Watch as the light builds up inside the ring (or doesn't).
+    """
+    t, input_pulse, transmitted, dropped, stored = simulate_resonators(
+        [resonator], pulse_duration, time_steps, t, input_pulse)
     
-    return t, input_pulse, transmitted, dropped, resonator.power_history
+    return t, input_pulse, transmitted[:, 0], dropped[:, 0], stored[:, 0]
 
 
-def create_comparison():
+def simulate_resonators(resonators, pulse_duration=10, time_steps=1000,
+                        t=None, input_pulse=None):
     """
-    Compare three resonator designs:
-    1. Standard ring (50/50 coupler)
-    2. φ-optimized ring (38.2%/61.8% coupler) 
-    3. Nested φ-rings (recursive structure)
+    Inject the same pulse of light into several ring resonators at once.
+    
+    The rings are independent, so they are stepped side by side in one pass
+    over the pulse. `resonators` is a RingBank, or a list of RingResonators
+    whose fields and histories are updated afterwards. Pass `t` and
+    `input_pulse` to reuse a pulse already built by gaussian_pulse();
+    otherwise one is made from pulse_duration and time_steps.
+    
+    Returns:
+        t, input_pulse: The shared time axis and input pulse
+        transmitted, dropped, stored: (time_steps, rings) float32 port and
+            stored powers, one column per resonator
     """
+    if t is None:
+        t, input_pulse = gaussian_pulse(pulse_duration, time_steps)
+    time_steps = len(t)
+    dt = t[1] - t[0]
     
-    print("="*70)
-    print("  PHOTONIC φ-PROCESSOR: Ring Resonator Simulation")
-    print("="*70)
-    print()
-    print("Comparing three designs:")
-    print("  1. Standard Ring (50% coupling)")
-    print("  2. φ-Optimized Ring (38.2% coupling)")
-    print("  3. Nested φ-Rings (recursive coupling)")
-    print()
+    if isinstance(resonators, RingBank):
+        bank = resonators
+    else:
+        bank = RingBank.from_resonators(resonators)
+    
+    # dt is fixed for the run, so each ring's propagation factor is prepared
+    # once and the whole pulse is stepped together
+    a_phase = bank.prepare(dt)
+    kappa = bank.kappa
+    tau = bank.tau
+    fields = bank.field.copy()
+    
+    # field[n] = a_phase·field[n-1] + κ·u[n] is a first-order IIR filter of
+    # the pulse, run per ring by scipy in C (or by a kernel specialized to
+    # that ring's design); the port powers then follow in one vectorized pass
+    u = input_pulse.astype(np.float32)
+    field = np.empty((time_steps, len(bank)), dtype=np.complex64)
+    if lfilter is not None:
+        pulse = u.astype(np.complex64)
+        for b in range(len(bank)):
+            field[:, b], _ = lfilter(kappa[b:b+1], np.array([1, -a_phase[b]], dtype=np.complex64),
+                                     pulse, zi=a_phase[b:b+1] * fields[b:b+1])
+    else:
+        out_field = np.empty(time_steps, dtype=np.complex64)
+        for b in range(len(bank)):
+            make_kernel(a_phase[b], kappa[b])(u, fields[b], out_field)
+            field[:, b] = out_field
+    fields = field[-1]
+    
+    u = u[:, None]
+    through = tau * u + 1j * kappa * field
+    drop = 1j * kappa * u + tau * field
+    transmitted = through.real * through.real + through.imag * through.imag
+    dropped = drop.real * drop.real + drop.imag * drop.imag
+    stored = field.real * field.real + field.imag * field.imag
+    
+    bank.field = fields
+    bank.power_hist = stored
+    bank.history_index = time_steps
+    if bank is not resonators:
+        for b, resonator in enumerate(resonators):
+            resonator.field_amplitude = fields[b]
+            resonator.power_history = stored[:, b]
+            resonator.history_index = time_steps
+    
+    q_factors = bank.quality_factor
+    finesse = bank.finesse
+    for b in range(len(bank)):
+        print(f"\n{'='*70}")
+        print(f"  Simulating: {bank.names[b]}")
+        print(f"{'='*70}")
+        print(f"  Radius: {bank.radius[b]*1e6:.2f} µm")
+        print(f"  Coupling: {bank.coupling[b]*100:.1f}%")
+        print(f"  Q-factor: {q_factors[b]:.1f}")
+        print(f"  Finesse: {finesse[b]:.1f}")
+        print()
+        
+        # Calculate average stored energy (after pulse)
+        avg_stored = np.mean(stored[time_steps//2:, b])
+        print(f"  Average stored power: {avg_stored:.6f}")
+        print(f"  Storage efficiency: {avg_stored/np.max(input_pulse)**2 * 100:.1f}%")
     
-    # Base parameters
-    base_radius = 5e-6  # 5 micrometers
-    pulse_duration = 100e-12  # 100 picoseconds
-    time_steps = 2000
+    return t, input_pulse, transmitted, dropped, stored
+
+
+def sweep_rings(radii, couplings, pulse_duration=10, time_steps=1000):
+    """
+    Stored power over time for many (radius, coupling) ring designs.
     
-    # Design 1: Standard ring (50/50 splitter)
-    standard = RingResonator(
-        radius=base_radius,
-        coupling_coefficient=0.5,  # 50%
-        name="Standard Ring (50% coupling)"
-    )
+    Meant for parameter scans: every design sees the same Gaussian pulse.
+    On the numpy backend with numba installed the designs run in parallel
+    through sweep_kernel; otherwise each time step is one vectorized update
+    across all B designs, on the backend chosen with set_backend().
     
-    # Design 2: φ-optimized ring
-    # Coupling ratio = 1/φ² ≈ 0.382 (38.2%)
-    phi_optimized = RingResonator(
-        radius=base_radius,
-        coupling_coefficient=1/PHI**2,
-        name="φ-Optimized Ring (38.2% coupling)"
-    )
+    Args:
+        radii: Ring radius of each design in meters
+        couplings: Power coupling coefficient of each design (0-1)
+        
+    Returns:
+        stored: (time_steps, B) float32 stored power, as an array of the backend
+    """
+    xp = XP
+    t, input_pulse = gaussian_pulse(pulse_duration, time_steps)
+    dt = t[1] - t[0]
     
-    # Design 3: Larger ring with φ-ratio radius
-    # This represents the first level of nesting
-    phi_nested = RingResonator(
-        radius=base_radius * PHI,
-        coupling_coefficient=1/PHI**2,
-        name="φ-Nested Ring (φ·radius, 38.2% coupling)"
-    )
+    bank = RingBank(radii, couplings)
+    a_phase = xp.asarray(bank.prepare(dt))
+    kappa = xp.asarray(bank.kappa)
+    u = xp.asarray(input_pulse, dtype=xp.float32)
     
-    # Run simulations
-    t1, inp1, trans1, drop1, stored1 = simulate_resonator_buildup(
-        standard, pulse_duration*1e12, time_steps)
+    stored = xp.empty((time_steps, len(bank)), dtype=xp.float32)
+    if xp is np and HAVE_NUMBA:
+        sweep_kernel(a_phase, kappa, u, stored)
+        return stored
     
-    t2, inp2, trans2, drop2, stored2 = simulate_resonator_buildup(
-        phi_optimized, pulse_duration*1e12, time_steps)
+    field = xp.zeros(len(bank), dtype=xp.complex64)
+    for i in range(time_steps):
+        field = a_phase * field + kappa * u[i]
+        stored[i] = field.real * field.real + field.imag * field.imag
     
-    t3, inp3, trans3, drop3, stored3 = simulate_resonator_buildup(
-        phi_nested, pulse_duration*1e12, time_steps)
+    return stored
+
+
+def render_comparison(t, inp, trans, stored, bank, names,
+                      save_path='photonic_ring_simulation.png'):
+    """
+    Save the nine-panel comparison figure for the three ring designs
+    (columns of `trans` / `stored` in the order of the RingBank `bank`).
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    
+    q_factors = bank.quality_factor
+    stored = np.asarray(stored)
+    trans1, trans2, trans3 = trans.T
+    stored1, stored2, stored3 = stored.T
+    pulse_duration = t[-1]
     
-    # Visualization
-    fig = plt.figure(figsize=(16, 12))
+    fig, axes = plt.subplots(3, 3, figsize=(16, 12))
     fig.suptitle('Photonic φ-Processor: Ring Resonator Performance', 
                  fontsize=16, fontweight='bold')
     
     # Plot 1: Input pulse
-    ax1 = plt.subplot(3, 3, 1)
-    ax1.plot(t1, inp1, color='purple', linewidth=2)
+    ax1 = axes[0, 0]
+    ax1.plot(t, inp, color='purple', linewidth=2)
     ax1.set_title('Input Pulse', fontsize=11, fontweight='bold')
     ax1.set_ylabel('Power (normalized)')
     ax1.grid(True, alpha=0.3)
-    ax1.set_xlim(0, pulse_duration*1e12)
+    ax1.set_xlim(0, pulse_duration)
     
     # Plot 2-4: Stored power in each design
     designs = [
-        (t1, stored1, standard, 'red', 2),
-        (t2, stored2, phi_optimized, 'gold', 3),
-        (t3, stored3, phi_nested, 'green', 4)
+        (stored1, 'red', axes[0, 1]),
+        (stored2, 'gold', axes[0, 2]),
+        (stored3, 'green', axes[1, 0])
     ]
     
-    for t, stored, resonator, color, subplot_idx in designs:
-        ax = plt.subplot(3, 3, subplot_idx)
-        ax.plot(t, stored, color=color, linewidth=2)
-        ax.set_title(f'{resonator.name}\nQ = {resonator.quality_factor():.0f}', 
+    for b, (stored_power, color, ax) in enumerate(designs):
+        ax.plot(t, stored_power, color=color, linewidth=2)
+        ax.set_title(f'{bank.names[b]}\nQ = {q_factors[b]:.0f}', 
                     fontsize=10, fontweight='bold')
         ax.set_ylabel('Stored Power')
         ax.grid(True, alpha=0.3)
-        ax.set_xlim(0, pulse_duration*1e12)
+        ax.set_xlim(0, pulse_duration)
         
         # Highlight the "memory" region (after pulse)
-        pulse_end = pulse_duration*1e12 / 3
-        ax.axvspan(pulse_end, pulse_duration*1e12, alpha=0.1, color=color)
+        pulse_end = pulse_duration / 3
+        ax.axvspan(pulse_end, pulse_duration, alpha=0.1, color=color)
     
     # Plot 5-7: Transmitted power
-    ax5 = plt.subplot(3, 3, 5)
-    ax5.plot(t1, trans1, color='red', linewidth=2, label='Standard')
+    ax5 = axes[1, 1]
+    ax5.plot(t, trans1, color='red', linewidth=2, label='Standard')
     ax5.set_title('Transmitted Power (Standard)', fontsize=10, fontweight='bold')
     ax5.set_ylabel('Power')
     ax5.grid(True, alpha=0.3)
     
-    ax6 = plt.subplot(3, 3, 6)
-    ax6.plot(t2, trans2, color='gold', linewidth=2, label='φ-Optimized')
+    ax6 = axes[1, 2]
+    ax6.plot(t, trans2, color='gold', linewidth=2, label='φ-Optimized')
     ax6.set_title('Transmitted Power (φ-Optimized)', fontsize=10, fontweight='bold')
     ax6.grid(True, alpha=0.3)
     
-    ax7 = plt.subplot(3, 3, 7)
-    ax7.plot(t3, trans3, color='green', linewidth=2, label='φ-Nested')
+    ax7 = axes[2, 0]
+    ax7.plot(t, trans3, color='green', linewidth=2, label='φ-Nested')
     ax7.set_title('Transmitted Power (φ-Nested)', fontsize=10, fontweight='bold')
     ax7.grid(True, alpha=0.3)
     
     # Plot 8: Comparison bar chart (Q-factors)
-    ax8 = plt.subplot(3, 3, 8)
-    q_factors = [r.quality_factor() for _, _, r, _, _ in designs]
-    colors = [c for _, _, _, c, _ in designs]
-    names = ['Standard', 'φ-Optimized', 'φ-Nested']
+    ax8 = axes[2, 1]
+    colors = [c for _, c, _ in designs]
     
     bars = ax8.bar(names, q_factors, color=colors, alpha=0.7, edgecolor='black', linewidth=2)
     ax8.set_ylabel('Q-Factor', fontsize=11, fontweight='bold')
@@ -303,27 +613,83 @@ def create_comparison():
                 ha='center', va='bottom', fontweight='bold', fontsize=10)
     
     # Plot 9: Energy efficiency (stored/input ratio over time)
-    ax9 = plt.subplot(3, 3, 9)
+    ax9 = axes[2, 2]
     
     # Calculate efficiency as ratio of stored to input
-    efficiency1 = np.array(stored1) / (np.max(inp1)**2 + 1e-10)
-    efficiency2 = np.array(stored2) / (np.max(inp2)**2 + 1e-10)
-    efficiency3 = np.array(stored3) / (np.max(inp3)**2 + 1e-10)
+    inp_max_sq = float(inp.max())**2
+    inv = 1.0 / (inp_max_sq + 1e-10)
+    efficiency1, efficiency2, efficiency3 = (stored * inv).T
     
-    ax9.plot(t1, efficiency1, color='red', linewidth=2, label='Standard', alpha=0.7)
-    ax9.plot(t2, efficiency2, color='gold', linewidth=2, label='φ-Optimized', alpha=0.8)
-    ax9.plot(t3, efficiency3, color='green', linewidth=2, label='φ-Nested', alpha=0.8)
+    ax9.plot(t, efficiency1, color='red', linewidth=2, label='Standard', alpha=0.7)
+    ax9.plot(t, efficiency2, color='gold', linewidth=2, label='φ-Optimized', alpha=0.8)
+    ax9.plot(t, efficiency3, color='green', linewidth=2, label='φ-Nested', alpha=0.8)
     
     ax9.set_title('Storage Efficiency (Stored/Input)', fontsize=11, fontweight='bold')
     ax9.set_ylabel('Efficiency')
     ax9.set_xlabel('Time (ps)')
     ax9.legend(fontsize=9)
     ax9.grid(True, alpha=0.3)
-    ax9.set_xlim(0, pulse_duration*1e12)
+    ax9.set_xlim(0, pulse_duration)
     
     plt.tight_layout()
-    plt.savefig('photonic_ring_simulation.png', dpi=300, bbox_inches='tight')
-    print("\n📊 Simulation visualization saved: photonic_ring_simulation.png\n")
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    print(f"\n📊 Simulation visualization saved: {save_path}\n")
+    plt.close(fig)
+
+
+def create_comparison(visualize=True, save_path='photonic_ring_simulation.png'):
+    """
+    Compare three resonator designs:
+    1. Standard ring (50/50 coupler)
+    2. φ-optimized ring (38.2%/61.8% coupler) 
+    3. Nested φ-rings (recursive structure)
+    
+    Args:
+        visualize: Render the comparison figure (the numbers don't need it)
+        save_path: Where render_comparison saves the figure
+        
+    Returns:
+        results: {'q_factors': Q per design name, 'stored': (steps, 3)
+            stored power}
+    """
+    
+    print("="*70)
+    print("  PHOTONIC φ-PROCESSOR: Ring Resonator Simulation")
+    print("="*70)
+    print()
+    print("Comparing three designs:")
+    print("  1. Standard Ring (50% coupling)")
+    print("  2. φ-Optimized Ring (38.2% coupling)")
+    print("  3. Nested φ-Rings (recursive coupling)")
+    print()
+    
+    # Base parameters
+    base_radius = 5e-6  # 5 micrometers
+    pulse_duration = 100e-12  # 100 picoseconds
+    time_steps = 2000
+    
+    # Design 1: Standard ring (50/50 splitter)
+    # Design 2: φ-optimized ring
+    #   Coupling ratio = 1/φ² ≈ 0.382 (38.2%)
+    # Design 3: Larger ring with φ-ratio radius
+    #   This represents the first level of nesting
+    bank = RingBank(
+        radii=[base_radius, base_radius, base_radius * PHI],
+        couplings=[0.5, 1/PHI**2, 1/PHI**2],
+        names=["Standard Ring (50% coupling)",
+               "φ-Optimized Ring (38.2% coupling)",
+               "φ-Nested Ring (φ·radius, 38.2% coupling)"]
+    )
+    names = ['Standard', 'φ-Optimized', 'φ-Nested']
+    q_factors = bank.quality_factor
+    
+    # Run simulations (the designs share one input pulse, so they run as
+    # one batch)
+    t, inp = gaussian_pulse(pulse_duration*1e12, time_steps)
+    _, _, trans, drop, stored = simulate_resonators(bank, t=t, input_pulse=inp)
+    
+    if visualize:
+        render_comparison(t, inp, trans, stored, bank, names, save_path)
     
     # Summary
     print("="*70)
@@ -342,6 +708,16 @@ def create_comparison():
     print(f"φ-Nesting improvement: {improvement_nested:.2f}x")
     print()
     
+    # Steady state needs no time stepping: it is one complex division
+    print("CW steady-state stored power (unit input; design λ / on resonance):")
+    design = bank.steady_state_field(1.0)
+    on_resonance = bank.steady_state_field(1.0, detuning=-bank.round_trip_phase)
+    design = design.real * design.real + design.imag * design.imag
+    on_resonance = on_resonance.real * on_resonance.real + on_resonance.imag * on_resonance.imag
+    for name, design, on_resonance in zip(names, design, on_resonance):
+        print(f"  {name:20s}: {design:8.3f} / {on_resonance:8.0f}")
+    print()
+    
     print("="*70)
     print("  CONCLUSION")
     print("="*70)
@@ -353,6 +729,8 @@ def create_comparison():
     print()
     print("Next step: Design full nested array for semantic processing")
     print()
+    
+    return {'q_factors': dict(zip(names, q_factors.tolist())), 'stored': stored}
 
 
 if __name__ == "__main__":
@@ -3,15 +3,63 @@ Practical Applications Visualization
 Generate 3D models and schematics for golden ratio energy devices
 """
 
+import hashlib
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # before pyplot, so no GUI backend is initialised
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 from matplotlib.patches import FancyArrowPatch, Circle, Rectangle
+from matplotlib.collections import LineCollection
 from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
 import matplotlib.patches as mpatches
 
+import phi_utils
+from phi_jit import HAVE_NUMBA, njit
+from phi_utils import draw_arrows
+
 PHI = (1 + np.sqrt(5)) / 2
 
+# Resolution of the saved PNGs; 150 is plenty on screen, publication or CI
+# builds can set DEVICES_DPI=300
+DPI = int(os.environ.get('DEVICES_DPI', 150))
+LN_PHI = math.log(PHI)
+
+# φ^(θ/2π) = exp(SPIRAL_GROWTH * θ): the golden spiral grows by φ per turn
+SPIRAL_GROWTH = LN_PHI / (2 * math.pi)
+
+# 100-point unit circle sampled once at import, shared by the round
+# outlines (repulsine chamber, bifilar template)
+CIRCLE_THETA = np.linspace(0, 2*np.pi, 100)
+CIRCLE_COS = np.cos(CIRCLE_THETA)
+CIRCLE_SIN = np.sin(CIRCLE_THETA)
+
+def source_hash():
+    """
+    Hash of this script, the shared helpers it draws with and DPI; saved
+    into the PNGs so reruns can skip them
+    """
+    digest = hashlib.blake2b(f'dpi={DPI}'.encode(), digest_size=16)
+    for path in (__file__, phi_utils.__file__):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def is_current(filename, digest):
+    """True if filename exists and was saved by this exact version of the script"""
+    from PIL import Image
+    
+    try:
+        with Image.open(filename) as im:
+            return im.text.get('Source-Hash') == digest
+    except OSError:
+        return False
+
 def create_practical_devices_visualization():
     """Create visualization of practical golden ratio devices"""
     fig = plt.figure(figsize=(20, 12))
@@ -55,10 +103,10 @@ def draw_vortex_turbine(ax):
     theta = np.linspace(0, turns * 2 * np.pi, turns * points_per_turn)
     
     # Nautilus-style spiral
-    r = 0.5 * np.power(PHI, theta / (2 * np.pi))
+    r = 0.5 * np.exp(SPIRAL_GROWTH * theta)
     
     # Blade angle (constant for golden spiral)
-    blade_angle = np.arctan(np.pi / (2 * np.log(PHI)))
+    blade_angle = np.arctan(np.pi / (2 * LN_PHI))
     
     # 3D coordinates for blade
     x = r * np.cos(theta)
@@ -115,16 +163,17 @@ def draw_spiral_antenna(ax):
     theta = np.linspace(0, turns * 2 * np.pi, turns * points_per_turn)
     
     # Logarithmic spiral (outward growth)
-    r = 0.2 * np.power(PHI, theta / (2 * np.pi))
+    r = 0.2 * np.exp(SPIRAL_GROWTH * theta)
     
     x = r * np.cos(theta)
     y = r * np.sin(theta)
     
-    # Draw spiral trace (copper)
-    for i in range(len(x)-1):
-        color_val = i / len(x)
-        ax.plot([x[i], x[i+1]], [y[i], y[i+1]], 
-               color=plt.cm.copper(color_val), linewidth=3)
+    # Draw spiral trace (copper), shaded along its length as one collection
+    points = np.column_stack([x, y])
+    segments = np.stack([points[:-1], points[1:]], axis=1)
+    colors = plt.cm.copper(np.arange(len(x)-1) / len(x))
+    ax.add_collection(LineCollection(segments, colors=colors, linewidth=3,
+                                     capstyle='projecting', rasterized=True))
     
     # Draw PCB substrate
     max_r = max(r) * 1.2
@@ -170,41 +219,46 @@ def draw_repulsine(ax):
                 fontweight='bold', fontsize=12)
     ax.set_facecolor('#1a1a2e')
     
-    # Egg-shaped chamber (cross-section)
-    theta = np.linspace(0, 2*np.pi, 100)
-    
-    # Egg shape (not perfect circle)
+    # Egg-shaped chamber (cross-section), egg shape (not perfect circle)
     a = 5  # Major axis
     b = 4  # Minor axis (slightly flattened)
-    x_egg = a * np.cos(theta)
-    y_egg = b * np.sin(theta) + 0.5 * np.sin(2*theta)  # Asymmetry
+    x_egg = a * CIRCLE_COS
+    y_egg = b * CIRCLE_SIN + 0.5 * np.sin(2*CIRCLE_THETA)  # Asymmetry
     
     ax.plot(x_egg, y_egg, 'silver', linewidth=3, label='Egg Chamber')
     ax.fill(x_egg, y_egg, color='#2a2a4e', alpha=0.5)
     
     # Spiral inflow paths (golden ratio)
     num_spirals = 4
+    colors = plt.cm.cool(np.arange(num_spirals) / num_spirals)
+    
+    # Spiral inward (the same profile for every spiral, only rotated)
+    spiral_theta = np.linspace(0, 3*np.pi, 50)
+    spiral_r = 6 * np.exp(-SPIRAL_GROWTH * spiral_theta)
+    np.clip(spiral_r, 0.5, None, out=spiral_r)  # Don't go below center
+    
+    arrow_x, arrow_y, arrow_dx, arrow_dy, arrow_colors = [], [], [], [], []
     for i in range(num_spirals):
         angle_offset = i * 2 * np.pi / num_spirals
         
-        # Spiral inward
-        spiral_theta = np.linspace(0, 3*np.pi, 50)
-        spiral_r = 6 * np.power(1/PHI, spiral_theta / (2*np.pi))
-        spiral_r = np.maximum(spiral_r, 0.5)  # Don't go below center
-        
         spiral_x = spiral_r * np.cos(spiral_theta + angle_offset)
         spiral_y = spiral_r * np.sin(spiral_theta + angle_offset)
         
-        color = plt.cm.cool(i / num_spirals)
+        color = colors[i]
         ax.plot(spiral_x, spiral_y, color=color, linewidth=2, alpha=0.7)
         
-        # Flow arrows
-        for j in range(10, len(spiral_x), 15):
-            if j < len(spiral_x) - 5:
-                dx = spiral_x[j] - spiral_x[j+5]
-                dy = spiral_y[j] - spiral_y[j+5]
-                ax.arrow(spiral_x[j], spiral_y[j], -dx, -dy,
-                        head_width=0.3, head_length=0.2, fc=color, ec=color, alpha=0.8)
+        # Flow arrows (collected here, drawn as one quiver below)
+        j = np.arange(10, len(spiral_x) - 5, 15)
+        arrow_x.append(spiral_x[j])
+        arrow_y.append(spiral_y[j])
+        arrow_dx.append(spiral_x[j+5] - spiral_x[j])
+        arrow_dy.append(spiral_y[j+5] - spiral_y[j])
+        arrow_colors += [color] * len(j)
+    
+    draw_arrows(ax, np.concatenate(arrow_x), np.concatenate(arrow_y),
+                np.concatenate(arrow_dx), np.concatenate(arrow_dy),
+                head_width=0.3, head_length=0.2, facecolor=arrow_colors,
+                edgecolor=arrow_colors, alpha=0.8)
     
     # Center singularity (implosion point)
     ax.plot(0, 0, 'o', color='yellow', markersize=20, markeredgecolor='white',
@@ -239,6 +293,57 @@ def draw_repulsine(ax):
     ax.axis('off')
     ax.legend(loc='lower right', fontsize=8)
 
+def rodin_wire_numpy(R, r, angles, num_wraps):
+    """
+    Rodin wire path on a torus (major radius R, minor radius r): 20 points
+    along each leg between consecutive pattern angles, wrapping around the
+    minor circle num_wraps times.
+    
+    Returns:
+        x, y, z: Path coordinates, (wraps, legs, 20) flattened
+    """
+    legs = np.linspace(angles, np.roll(angles, -1), 20, axis=-1)
+    t = np.broadcast_to(legs, (num_wraps,) + legs.shape).ravel()
+    wrap = np.repeat(np.arange(num_wraps), legs.size)
+    
+    # Position on major circle
+    x_center = R * np.cos(t)
+    y_center = R * np.sin(t)
+    
+    # Add minor circle variation (wrapping around)
+    v_angle = wrap * 2*np.pi / num_wraps + t
+    x = x_center + r * np.cos(v_angle) * np.cos(t)
+    y = y_center + r * np.cos(v_angle) * np.sin(t)
+    z = r * np.sin(v_angle)
+    return x, y, z
+
+@njit('UniTuple(f8[:], 3)(f8, f8, f8[:], i8)', cache=True, fastmath=True)
+def rodin_wire_loops(R, r, angles, num_wraps):
+    """Same path as rodin_wire_numpy, as scalar loops for numba to compile"""
+    n_legs = len(angles)
+    n = num_wraps * n_legs * 20
+    x = np.empty(n)
+    y = np.empty(n)
+    z = np.empty(n)
+    k = 0
+    for wrap in range(num_wraps):
+        for i in range(n_legs):
+            angle1 = angles[i]
+            angle2 = angles[(i+1) % n_legs]
+            step = (angle2 - angle1) / 19
+            for j in range(20):
+                t = angle2 if j == 19 else angle1 + j * step
+                v_angle = wrap * 2*np.pi / num_wraps + t
+                x[k] = R * np.cos(t) + r * np.cos(v_angle) * np.cos(t)
+                y[k] = R * np.sin(t) + r * np.cos(v_angle) * np.sin(t)
+                z[k] = r * np.sin(v_angle)
+                k += 1
+    return x, y, z
+
+# The compiled loops beat NumPy's per-call dispatch at this size; as plain
+# Python they would not
+build_rodin_wire = rodin_wire_loops if HAVE_NUMBA else rodin_wire_numpy
+
 def draw_rodin_coil(ax):
     """Draw Rodin coil winding on torus"""
     ax.set_title('4. Rodin Coil (Toroidal)', fontweight='bold', fontsize=12)
@@ -247,9 +352,10 @@ def draw_rodin_coil(ax):
     R = 3  # Major radius
     r = 1  # Minor radius
     
-    # Generate torus surface (semi-transparent)
-    u = np.linspace(0, 2*np.pi, 30)
-    v = np.linspace(0, 2*np.pi, 30)
+    # Generate torus surface (semi-transparent, so a 20x20 mesh is plenty
+    # and keeps the 3D depth sort cheap)
+    u = np.linspace(0, 2*np.pi, 20)
+    v = np.linspace(0, 2*np.pi, 20)
     U, V = np.meshgrid(u, v)
     
     X = (R + r * np.cos(V)) * np.cos(U)
@@ -260,36 +366,13 @@ def draw_rodin_coil(ax):
     
     # Rodin winding pattern: 1-2-4-8-7-5-1 (based on doubling circuit)
     positions = [1, 2, 4, 8, 7, 5]  # Position numbers on 9-point circle
-    angles = [pos * 2*np.pi / 9 for pos in positions]
+    angles = np.array(positions) * 2*np.pi / 9
     
     # Draw winding
     num_wraps = 3
-    wire_points = []
-    
-    for wrap in range(num_wraps):
-        for i in range(len(angles)):
-            angle1 = angles[i]
-            angle2 = angles[(i+1) % len(angles)]
-            
-            # Points on torus surface
-            theta = np.linspace(angle1, angle2, 20)
-            
-            for t in theta:
-                # Position on major circle
-                x_center = R * np.cos(t)
-                y_center = R * np.sin(t)
-                
-                # Add minor circle variation (wrapping around)
-                v_angle = wrap * 2*np.pi / num_wraps + t
-                x = x_center + r * np.cos(v_angle) * np.cos(t)
-                y = y_center + r * np.cos(v_angle) * np.sin(t)
-                z = r * np.sin(v_angle)
-                
-                wire_points.append([x, y, z])
+    x, y, z = build_rodin_wire(float(R), float(r), angles, num_wraps)
     
-    wire_points = np.array(wire_points)
-    ax.plot(wire_points[:, 0], wire_points[:, 1], wire_points[:, 2],
-           'r-', linewidth=2, label='Wire Path')
+    ax.plot(x, y, z, 'r-', linewidth=2, label='Wire Path')
     
     # Mark positions
     for i, angle in enumerate(angles):
@@ -337,14 +420,12 @@ def draw_caduceus_coil(ax):
     z2 = np.linspace(-5, 5, len(theta2))
     ax.plot(x2, y2, z2, 'b-', linewidth=2, label='Wire 2 (CCW)')
     
-    # Field cancellation arrows (external)
-    for z_pos in [-3, 0, 3]:
-        # Wire 1 field
-        ax.quiver(2, 0, z_pos, 0.5, 0, 0, color='red', alpha=0.5, 
-                 arrow_length_ratio=0.3)
-        # Wire 2 field (opposite)
-        ax.quiver(-2, 0, z_pos, -0.5, 0, 0, color='blue', alpha=0.5, 
-                 arrow_length_ratio=0.3)
+    # Field cancellation arrows (external): wire 1 field (red) and the
+    # opposite wire 2 field (blue) at three heights, as one quiver
+    z_pos = np.repeat([-3, 0, 3], 2)
+    x_pos = np.tile([2, -2], 3)
+    ax.quiver(x_pos, np.zeros(6), z_pos, x_pos / 4, np.zeros(6), np.zeros(6),
+             color=['red', 'blue'] * 3, alpha=0.5, arrow_length_ratio=0.3)
     
     # Center scalar field indication
     ax.text(0, 0, 0, '⚡', fontsize=40, ha='center', va='center', color='yellow')
@@ -395,8 +476,8 @@ def draw_phase_conjugate(ax):
     # Spiral coils (creating the mirror)
     # Left coil
     spiral_theta = np.linspace(0, 4*np.pi, 100)
-    spiral_r = 2 * np.power(1/PHI, spiral_theta/(2*np.pi))
-    spiral_r = np.maximum(spiral_r, 0.3)
+    spiral_r = 2 * np.exp(-SPIRAL_GROWTH * spiral_theta)
+    np.clip(spiral_r, 0.3, None, out=spiral_r)
     spiral_x_left = -5 + spiral_r * np.cos(spiral_theta)
     spiral_y_left = spiral_r * np.sin(spiral_theta)
     ax.plot(spiral_x_left, spiral_y_left, 'r-', linewidth=1, alpha=0.5)
@@ -422,6 +503,16 @@ def draw_phase_conjugate(ax):
     ax.legend(loc='upper left', fontsize=8)
     ax.grid(True, alpha=0.3)
 
+@lru_cache(maxsize=None)
+def rodin_angles(n=9):
+    """
+    Angles of the n Rodin marking positions 1..n, starting at the top.
+    Cached, so the returned array is read-only.
+    """
+    angles = np.arange(1, n+1) * 2*np.pi / n - np.pi/2
+    angles.flags.writeable = False
+    return angles
+
 def generate_coil_winding_guide():
     """Generate printable coil winding patterns"""
     fig, axes = plt.subplots(2, 2, figsize=(16, 16))
@@ -433,11 +524,12 @@ def generate_coil_winding_guide():
     
     turns = 8
     theta = np.linspace(0, turns * 2 * np.pi, 1000)
-    r = 10 * np.power(PHI, theta / (2*np.pi))  # Start at 10mm
+    r = 10 * np.exp(SPIRAL_GROWTH * theta)  # Start at 10mm
     x = r * np.cos(theta)
     y = r * np.sin(theta)
     
-    ax.plot(x, y, 'k-', linewidth=2)
+    # 1000 vertices: rasterized, so a vector (PDF/SVG) save stays small
+    ax.plot(x, y, 'k-', linewidth=2, rasterized=True)
     ax.plot(0, 0, 'ro', markersize=10)
     ax.text(0, -max(r)*1.1, 'Center Feedpoint', ha='center', fontsize=10)
     
@@ -460,25 +552,18 @@ def generate_coil_winding_guide():
     circle = Circle((0, 0), 100, fill=False, edgecolor='black', linewidth=2)
     ax.add_patch(circle)
     
+    angles = rodin_angles()
+    x = 100 * np.cos(angles)
+    y = 100 * np.sin(angles)
+    ax.scatter(x, y, s=15**2, color='r', zorder=2)
     for pos in range(1, 10):
-        angle = pos * 2*np.pi / 9
-        x = 100 * np.cos(angle - np.pi/2)  # Start at top
-        y = 100 * np.sin(angle - np.pi/2)
-        
-        ax.plot(x, y, 'ro', markersize=15)
-        ax.text(x*1.15, y*1.15, str(pos), fontsize=14, fontweight='bold',
+        ax.text(x[pos-1]*1.15, y[pos-1]*1.15, str(pos), fontsize=14, fontweight='bold',
                ha='center', va='center')
     
     # Winding order arrows
-    winding_order = [1, 2, 4, 8, 7, 5, 1]
-    for i in range(len(winding_order)-1):
-        angle1 = winding_order[i] * 2*np.pi / 9 - np.pi/2
-        angle2 = winding_order[i+1] * 2*np.pi / 9 - np.pi/2
-        
-        x1, y1 = 100 * np.cos(angle1), 100 * np.sin(angle1)
-        x2, y2 = 100 * np.cos(angle2), 100 * np.sin(angle2)
-        
-        ax.annotate('', xy=(x2, y2), xytext=(x1, y1),
+    winding_order = np.array([1, 2, 4, 8, 7, 5, 1]) - 1
+    for start, end in zip(winding_order[:-1], winding_order[1:]):
+        ax.annotate('', xy=(x[end], y[end]), xytext=(x[start], y[start]),
                    arrowprops=dict(arrowstyle='->', lw=2, color='blue'))
     
     ax.text(0, 0, 'Winding Order:\n1→2→4→8→7→5→1', ha='center', fontsize=10,
@@ -494,21 +579,17 @@ def generate_coil_winding_guide():
     ax.set_title('Bifilar Pancake Coil Template', fontsize=12, fontweight='bold')
     
     turns = 10
-    for turn in range(turns):
-        r_inner = 10 + turn * 5
-        r_outer = r_inner + 3
-        
-        theta = np.linspace(0, 2*np.pi, 100)
-        
-        # Wire 1
-        x1 = r_inner * np.cos(theta)
-        y1 = r_inner * np.sin(theta)
-        ax.plot(x1, y1, 'r-', linewidth=2)
-        
-        # Wire 2 (parallel)
-        x2 = r_outer * np.cos(theta)
-        y2 = r_outer * np.sin(theta)
-        ax.plot(x2, y2, 'b-', linewidth=2)
+    r_inner = 10 + np.arange(turns) * 5
+    r_outer = r_inner + 3
+    
+    # Unit circle, scaled to every turn's radius at once: (turns, 100, 2)
+    circle = np.column_stack([CIRCLE_COS, CIRCLE_SIN])
+    
+    # Wire 1, and wire 2 running parallel outside it
+    ax.add_collection(LineCollection(r_inner[:, None, None] * circle,
+                                     colors='r', linewidth=2, capstyle='projecting'))
+    ax.add_collection(LineCollection(r_outer[:, None, None] * circle,
+                                     colors='b', linewidth=2, capstyle='projecting'))
     
     ax.plot(0, 0, 'ko', markersize=10)
     ax.text(0, -70, 'Connect:\nRed_start ↔ Blue_end\nBlue_start ↔ Red_end',
@@ -526,25 +607,21 @@ def generate_coil_winding_guide():
     
     # Winding positions
     num_turns = 12
-    for turn in range(num_turns):
-        y = turn * 100 / num_turns
-        
-        # CW wire position
-        x_cw = 20 * np.sin(turn * 2*np.pi / num_turns)
-        ax.plot(x_cw, y, 'ro', markersize=8)
-        
-        # CCW wire position (opposite side)
-        x_ccw = -x_cw
-        ax.plot(x_ccw, y, 'bo', markersize=8)
-        
-        # Connecting line
-        if turn > 0:
-            y_prev = (turn-1) * 100 / num_turns
-            x_cw_prev = 20 * np.sin((turn-1) * 2*np.pi / num_turns)
-            x_ccw_prev = -x_cw_prev
-            
-            ax.plot([x_cw_prev, x_cw], [y_prev, y], 'r-', linewidth=1, alpha=0.5)
-            ax.plot([x_ccw_prev, x_ccw], [y_prev, y], 'b-', linewidth=1, alpha=0.5)
+    turns = np.arange(num_turns)
+    y = turns * 100 / num_turns
+    
+    # CW wire positions, and the CCW wire on the opposite side
+    x_cw = 20 * np.sin(turns * 2*np.pi / num_turns)
+    x_ccw = -x_cw
+    ax.scatter(x_cw, y, s=8**2, color='r', zorder=2)
+    ax.scatter(x_ccw, y, s=8**2, color='b', zorder=2)
+    
+    # Connecting lines between consecutive turns
+    for x_wire, color in ((x_cw, 'r'), (x_ccw, 'b')):
+        points = np.column_stack([x_wire, y])
+        ax.add_collection(LineCollection(np.stack([points[:-1], points[1:]], axis=1),
+                                         colors=color, linewidth=1, alpha=0.5,
+                                         capstyle='projecting'))
     
     ax.text(30, 50, 'Red: CW\nBlue: CCW\nWind\nsimultaneously',
            fontsize=10, bbox=dict(boxstyle='round', facecolor='wheat'))
@@ -556,20 +633,56 @@ def generate_coil_winding_guide():
     plt.tight_layout()
     return fig
 
+def save_png(fig, filename, digest=None):
+    """Save fig at DPI, tagged with the source hash for is_current()"""
+    fig.savefig(filename, dpi=DPI, bbox_inches='tight',
+                metadata={'Source-Hash': digest or source_hash()},
+                pil_kwargs={'compress_level': 1})
+
+def save_practical_devices(filename='practical_devices.png', digest=None):
+    """Build the device figure and save it; the caller closes the returned figure"""
+    fig = create_practical_devices_visualization()
+    save_png(fig, filename, digest)
+    return fig
+
+def save_coil_winding_guide(filename='coil_winding_templates.png', digest=None):
+    """Build the coil templates and save them; the caller closes the returned figure"""
+    fig = generate_coil_winding_guide()
+    save_png(fig, filename, digest)
+    return fig
+
+# file -> function that builds and saves it
+FIGURES = {
+    'practical_devices.png': save_practical_devices,
+    'coil_winding_templates.png': save_coil_winding_guide,
+}
+
+def render(filename, digest=None):
+    """Build, save and close one figure in a worker process"""
+    plt.close(FIGURES[filename](filename, digest))
+    return filename
+
 if __name__ == "__main__":
     print("=" * 70)
     print("PRACTICAL GOLDEN RATIO DEVICES - Visualization")
     print("=" * 70)
     
-    print("\nGenerating device schematics...")
-    fig_devices = create_practical_devices_visualization()
-    fig_devices.savefig('practical_devices.png', dpi=300, bbox_inches='tight')
-    print("Saved: practical_devices.png")
-    
-    print("\nGenerating coil winding templates...")
-    fig_coils = generate_coil_winding_guide()
-    fig_coils.savefig('coil_winding_templates.png', dpi=300, bbox_inches='tight')
-    print("Saved: coil_winding_templates.png")
+    # Both figures are deterministic, so a PNG saved by this same source
+    # (matching Source-Hash) is reused; delete it to force a re-render
+    digest = source_hash()
+    stale = []
+    for filename in FIGURES:
+        if is_current(filename, digest):
+            print(f"\nUp to date: {filename}")
+        else:
+            stale.append(filename)
+    
+    # The two figures are independent, so each renders in its own process
+    if stale:
+        print("\nGenerating device schematics and coil winding templates...")
+        with ProcessPoolExecutor(max_workers=min(len(stale), os.cpu_count() or 1)) as executor:
+            for filename in executor.map(render, stale, [digest] * len(stale)):
+                print(f"Saved: {filename}")
     
     print("\n✨ Practical device visualizations complete!")
     print("\nDevices visualized:")
@@ -587,5 +700,3 @@ if __name__ == "__main__":
     
     print("\n⚠️  Build at your own risk. Some designs are experimental.")
     print("📏 Measure everything. Document results. Stay safe!")
-    
-    plt.close('all')
@@ -0,0 +1,39 @@
+"""
+Render all of the saved figures in parallel.
+
+golden_mirror_2d.png, golden_mirror_3d.png, phi_ai_architecture.png,
+practical_devices.png and coil_winding_templates.png are independent, so
+each is built and encoded in its own process on the non-interactive Agg
+backend.
+"""
+
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# task name -> (module, function that builds + saves the figure and returns it)
+TASKS = {
+    'mirror2d': ('golden_mirror_save', 'save_2d_visualization'),
+    'mirror3d': ('golden_mirror_save', 'save_3d_visualization'),
+    'arch': ('phi_ai_architecture', 'save_architecture_comparison'),
+    'devices': ('practical_devices', 'save_practical_devices'),
+    'coils': ('practical_devices', 'save_coil_winding_guide'),
+}
+
+def render(task):
+    """Run one task in a worker process"""
+    import matplotlib
+    matplotlib.use('Agg')  # before pyplot, so no GUI backend is initialised
+    import matplotlib.pyplot as plt
+    
+    module_name, func_name = TASKS[task]
+    fig = getattr(importlib.import_module(module_name), func_name)()
+    plt.close(fig)
+    return task
+
+if __name__ == "__main__":
+    print("Rendering figures...")
+    with ProcessPoolExecutor(max_workers=min(len(TASKS), os.cpu_count() or 1)) as executor:
+        for task in executor.map(render, TASKS):
+            print(f"✓ {task}")
+    print("\n✨ All figures rendered.")